@@ -13,9 +13,10 @@ Provides comprehensive caching functionality including:
 """
 
 from .cache_manager import CacheManager
-from .memory_cache import MemoryCache, QuoteCache, SearchCache, quote_cache, search_cache, general_cache
+from .memory_cache import MemoryCache, QuoteCache, SearchCache, SingleFlight, RecentSymbols, quote_cache, search_cache, general_cache, single_flight
+from .response_cache import TTLResponseCache, response_cache, symbol_search_cache, serialize_response
 from .search_optimizer import SearchOptimizer, get_search_optimizer
-from .background_manager import BackgroundCacheManager, start_cache_background_tasks, stop_cache_background_tasks
+from .background_manager import BackgroundCacheManager, start_cache_background_tasks, stop_cache_background_tasks, request_cache_refresh
 from .data_seeder import DataSeeder, get_data_seeder
 from .migrations import CacheMigration, migrate_database, check_migration_status
 from .quote_ttl_manager import QuoteTTLManager, get_ttl_manager, get_ttl_for_asset
@@ -43,6 +44,13 @@ __all__ = [
     'quote_cache',
     'search_cache', 
     'general_cache',
+    'SingleFlight',
+    'single_flight',
+    'RecentSymbols',
+    'TTLResponseCache',
+    'response_cache',
+    'symbol_search_cache',
+    'serialize_response',
     
     # Search optimization
     'SearchOptimizer',
@@ -52,6 +60,7 @@ __all__ = [
     'BackgroundCacheManager',
     'start_cache_background_tasks',
     'stop_cache_background_tasks',
+    'request_cache_refresh',
     
     # Data seeding
     'DataSeeder',
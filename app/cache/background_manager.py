@@ -5,20 +5,28 @@ from typing import Optional
 import threading
 from app.cache.cache_manager import CacheManager
 from app.cache.memory_cache import cleanup_expired_caches
+from app.cache.response_cache import symbol_search_cache
 
 logger = logging.getLogger(__name__)
 
 class BackgroundCacheManager:
     """Manages background cache refresh and cleanup tasks."""
     
-    def __init__(self, cache_manager: CacheManager, stock_client, fund_client, gold_client):
+    def __init__(self, cache_manager: CacheManager, stock_client, fund_client, gold_client, data_seeder=None):
         self.cache_manager = cache_manager
         self.stock_client = stock_client
         self.fund_client = fund_client
         self.gold_client = gold_client
+        # Republishes its symbol -> asset type index after listings reload
+        self.data_seeder = data_seeder
         self._running = False
         self._task: Optional[asyncio.Task] = None
         self._cleanup_thread: Optional[threading.Thread] = None
+        # Set to run the asset refresh now instead of at the next interval;
+        # created on the running loop in start_background_tasks
+        self._refresh_requested: Optional[asyncio.Event] = None
+        # Set on stop so the cleanup thread wakes immediately instead of polling
+        self._stop_event = threading.Event()
         
         # Exchange mapping for compatibility
         self.exchange_mapping = {
@@ -34,8 +42,11 @@ class BackgroundCacheManager:
             return
         
         self._running = True
+        self._stop_event.clear()
         logger.info("Starting background cache management tasks")
         
+        self._refresh_requested = asyncio.Event()
+        
         # Start cache refresh task
         self._task = asyncio.create_task(self._periodic_cache_refresh())
         
@@ -49,6 +60,7 @@ class BackgroundCacheManager:
             return
         
         self._running = False
+        self._stop_event.set()
         logger.info("Stopping background cache management tasks")
         
         if self._task:
@@ -62,41 +74,69 @@ class BackgroundCacheManager:
     
     async def _periodic_cache_refresh(self):
         """Periodically refresh cache data."""
+        initial = True
         while self._running:
             try:
-                await self._refresh_asset_data()
-                await asyncio.sleep(36000)  # Refresh every 10 hours
+                await self._refresh_asset_data(initial=initial)
+                initial = False
+                # Refresh every 10 hours, or as soon as a refresh is requested
+                try:
+                    await asyncio.wait_for(self._refresh_requested.wait(), timeout=36000)
+                except asyncio.TimeoutError:
+                    pass
+                self._refresh_requested.clear()
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error in periodic cache refresh: {e}")
                 await asyncio.sleep(300)  # Wait 5 minutes on error
     
-    async def _refresh_asset_data(self):
-        """Refresh asset data in cache."""
+    def request_refresh(self):
+        """Wake the refresh task to reload listings now (must be called on the event loop)."""
+        if self._refresh_requested is not None:
+            self._refresh_requested.set()
+    
+    async def _refresh_asset_data(self, initial: bool = False):
+        """Refresh asset data in cache.
+        
+        The initial pass runs right after startup loaded the listings, so it keeps
+        the /search/{symbol} cache that the startup warm-up is filling.
+        """
         try:
             logger.info("Starting asset data refresh")
             
+            # Each step downloads listings and writes SQLite, so run it off the event loop
             # Refresh stock data
-            await self._refresh_stock_data()
+            await asyncio.to_thread(self._refresh_stock_data, initial)
             
             # Refresh fund data
-            await self._refresh_fund_data()
+            await asyncio.to_thread(self._refresh_fund_data, initial)
             
             # Refresh gold provider data
-            await self._refresh_gold_data()
+            await asyncio.to_thread(self._refresh_gold_data)
+            
+            # Route newly listed symbols without waiting for a reseed; the initial
+            # pass follows startup seeding, which already published the index
+            if self.data_seeder and not initial:
+                await asyncio.to_thread(self.data_seeder._publish_asset_type_index)
             
             logger.info("Asset data refresh completed")
         except Exception as e:
             logger.error(f"Error refreshing asset data: {e}")
     
-    async def _refresh_stock_data(self):
+    def _refresh_stock_data(self, initial: bool = False):
         """Refresh stock symbols and basic data."""
         try:
-            # This will trigger a refresh of the companies cache
-            companies_df = self.stock_client._get_companies_df()
+            # Later passes reload the listing from the provider; the initial pass
+            # reuses the listing startup just loaded
+            if initial:
+                companies_df = self.stock_client._get_companies_df()
+            else:
+                companies_df = self.stock_client.refresh_companies_df()
             if companies_df is not None and not companies_df.empty:
                 logger.info(f"Refreshed {len(companies_df)} stock symbols")
+                if not initial:
+                    symbol_search_cache.clear()
                 
                 # Cache some popular stocks
                 popular_symbols = ["VNM", "FPT", "MWG", "VCB", "BID", "TCB", "VIC"]
@@ -122,12 +162,20 @@ class BackgroundCacheManager:
         except Exception as e:
             logger.error(f"Error refreshing stock data: {e}")
     
-    async def _refresh_fund_data(self):
+    def _refresh_fund_data(self, initial: bool = False):
         """Refresh fund data."""
         try:
-            funds = self.fund_client.get_funds_list()
+            # Later passes force a reload so request-time fund routing never has to
+            # refresh the expired listing itself; the initial pass reuses the
+            # listing startup just loaded
+            if initial:
+                funds = self.fund_client.get_funds_list()
+            else:
+                funds = self.fund_client.refresh_funds_list()
             if funds:
                 logger.info(f"Refreshed {len(funds)} funds")
+                if not initial:
+                    symbol_search_cache.clear()
                 
                 # Cache all funds
                 for fund in funds:
@@ -146,7 +194,7 @@ class BackgroundCacheManager:
         except Exception as e:
             logger.error(f"Error refreshing fund data: {e}")
     
-    async def _refresh_gold_data(self):
+    def _refresh_gold_data(self):
         """Refresh gold provider data."""
         try:
             gold_providers = self.gold_client.get_all_gold_providers()
@@ -176,37 +224,38 @@ class BackgroundCacheManager:
                 cleanup_expired_caches()
                 self.cache_manager.cleanup_expired()
                 
-                # Sleep for 30 minutes
-                for _ in range(1800):  # 30 minutes in seconds
-                    if not self._running:
-                        break
-                    threading.Event().wait(1)
+                # Sleep for 30 minutes (returns early on stop)
+                self._stop_event.wait(1800)
                     
             except Exception as e:
                 logger.error(f"Error in periodic cleanup: {e}")
                 # Wait 5 minutes on error
-                for _ in range(300):
-                    if not self._running:
-                        break
-                    threading.Event().wait(1)
+                self._stop_event.wait(300)
 
 # Global background cache manager instance
 _background_manager: Optional[BackgroundCacheManager] = None
 
-def get_background_manager(cache_manager: CacheManager, stock_client, fund_client, gold_client) -> BackgroundCacheManager:
+def get_background_manager(cache_manager: CacheManager, stock_client, fund_client, gold_client, data_seeder=None) -> BackgroundCacheManager:
     """Get or create global background cache manager."""
     global _background_manager
     if _background_manager is None:
-        _background_manager = BackgroundCacheManager(cache_manager, stock_client, fund_client, gold_client)
+        _background_manager = BackgroundCacheManager(cache_manager, stock_client, fund_client, gold_client, data_seeder)
     return _background_manager
 
-async def start_cache_background_tasks(cache_manager: CacheManager, stock_client, fund_client, gold_client):
+async def start_cache_background_tasks(cache_manager: CacheManager, stock_client, fund_client, gold_client, data_seeder=None):
     """Start background cache tasks."""
-    manager = get_background_manager(cache_manager, stock_client, fund_client, gold_client)
+    manager = get_background_manager(cache_manager, stock_client, fund_client, gold_client, data_seeder)
     await manager.start_background_tasks()
 
 async def stop_cache_background_tasks():
     """Stop background cache tasks."""
     global _background_manager
     if _background_manager:
-        await _background_manager.stop_background_tasks()
\ No newline at end of file
+        await _background_manager.stop_background_tasks()
+
+def request_cache_refresh() -> bool:
+    """Ask the running background manager to refresh listings now; False if none is running."""
+    if _background_manager is None or not _background_manager._running:
+        return False
+    _background_manager.request_refresh()
+    return True
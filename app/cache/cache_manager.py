@@ -160,6 +160,20 @@ class CacheManager:
             finally:
                 conn.close()
     
+    def get_asset_types(self) -> Dict[str, str]:
+        """Return a symbol -> asset_type mapping for every cached asset."""
+        with self._lock:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                cursor = conn.cursor()
+                cursor.execute('SELECT symbol, asset_type FROM assets')
+                return {row[0]: row[1] for row in cursor.fetchall() if row[0] and row[1]}
+            except Exception as e:
+                logger.error(f"Error retrieving asset types: {e}")
+                return {}
+            finally:
+                conn.close()
+    
     def search_assets_by_name(self, query: str, limit: int = 10) -> List[Dict]:
         """Search assets by name or symbol using FTS."""
         with self._lock:
@@ -1,9 +1,12 @@
 import asyncio
 import logging
+import sys
 from datetime import datetime
-from typing import List, Dict, Optional
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional
 from app.cache.cache_manager import CacheManager
 from app.cache.memory_cache import quote_cache
+from app.constants import SYMBOL_TO_TYPE
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +21,9 @@ class DataSeeder:
         self._seeding_progress = 0
         self._total_assets = 0
         
+        # Symbol -> asset type for every seeded asset, republished after each seeding run
+        self.asset_type_index: Mapping[str, str] = MappingProxyType({})
+        
         # Exchange mapping for compatibility
         self.exchange_mapping = {
             'HSX': 'HOSE',  # Ho Chi Minh Stock Exchange
@@ -38,11 +44,12 @@ class DataSeeder:
         logger.info("Starting initial asset data seeding...")
         start_time = datetime.now()
         
-        # Check if we already have data
+        # Check if we already have data (SQLite counts, so kept off the event loop)
         if not force_refresh:
-            existing_stats = self.cache_manager.get_stats()
+            existing_stats = await asyncio.to_thread(self.cache_manager.get_stats)
             if existing_stats.get('assets', 0) > 100:  # Assume seeded if we have substantial data
                 logger.info(f"Cache already contains {existing_stats['assets']} assets, skipping seeding")
+                await asyncio.to_thread(self._publish_asset_type_index)
                 return existing_stats
         
         try:
@@ -84,7 +91,9 @@ class DataSeeder:
             logger.info(f"Seeding completed in {duration:.2f}s: {counts}")
             
             # Cleanup any expired entries
-            self.cache_manager.cleanup_expired()
+            await asyncio.to_thread(self.cache_manager.cleanup_expired)
+            
+            await asyncio.to_thread(self._publish_asset_type_index)
             
             return counts
             
@@ -97,52 +106,14 @@ class DataSeeder:
         try:
             logger.info("Seeding stocks...")
             
-            # Get all companies from vnstock
-            companies_df = self.stock_client._get_companies_df()
+            # Get all companies from vnstock (off the event loop so the other seeders overlap it)
+            companies_df = await asyncio.to_thread(self.stock_client._get_companies_df)
             if companies_df is None or companies_df.empty:
                 logger.warning("No stock data available from vnstock")
                 return {'count': 0}
             
-            stocks_seeded = 0
-            batch_size = 100
-            total_stocks = len(companies_df)
-            
-            # Process in batches to avoid memory issues
-            for batch_start in range(0, total_stocks, batch_size):
-                batch_end = min(batch_start + batch_size, total_stocks)
-                batch = companies_df.iloc[batch_start:batch_end]
-                
-                for _, row in batch.iterrows():
-                    try:
-                        symbol = str(row.get("symbol", "")).strip()
-                        company_name = str(row.get("organ_name", "")).strip()
-                        industry = str(row.get("organ_type", "")).strip()
-                        company_type = str(row.get("com_type", "")).strip()
-                        exchange = str(row.get("exchange", "")).strip()
-                        mapped_exchange = self.exchange_mapping.get(exchange, exchange)
-                        
-                        if symbol and company_name:
-                            self.cache_manager.set_asset(
-                                symbol=symbol,
-                                name=company_name,
-                                asset_type="STOCK",
-                                asset_class="Equity",
-                                asset_sub_class="Stock",
-                                exchange=mapped_exchange,  # Use mapped exchange from data
-                                currency="VND",
-                                metadata={
-                                    "industry": industry,
-                                    "company_type": company_type,
-                                    "listing_source": "vnstock"
-                                }
-                            )
-                            stocks_seeded += 1
-                    except Exception as e:
-                        logger.debug(f"Error seeding stock {row.get('symbol', 'unknown')}: {e}")
-                
-                # Update progress
-                self._seeding_progress = batch_end
-                logger.debug(f"Seeded {batch_end}/{total_stocks} stocks")
+            # Thousands of SQLite writes; run them off the event loop too
+            stocks_seeded = await asyncio.to_thread(self._store_stocks, companies_df)
             
             logger.info(f"Successfully seeded {stocks_seeded} stocks")
             return {'count': int(stocks_seeded)}
@@ -151,39 +122,63 @@ class DataSeeder:
             logger.error(f"Error seeding stocks: {e}")
             return {'count': 0}
     
-    async def _seed_funds(self) -> Dict[str, int]:
-        """Seed all available funds from fund API."""
-        try:
-            logger.info("Seeding funds...")
-            
-            # Get all funds
-            funds = self.fund_client.get_funds_list()
-            if not funds:
-                logger.warning("No fund data available")
-                return {'count': 0}
+    def _store_stocks(self, companies_df) -> int:
+        """Write the stock listing into the assets table; returns the number stored."""
+        stocks_seeded = 0
+        batch_size = 100
+        total_stocks = len(companies_df)
+        
+        # Process in batches to avoid memory issues
+        for batch_start in range(0, total_stocks, batch_size):
+            batch_end = min(batch_start + batch_size, total_stocks)
+            batch = companies_df.iloc[batch_start:batch_end]
             
-            funds_seeded = 0
-            for fund in funds:
+            for _, row in batch.iterrows():
                 try:
-                    symbol = fund.get("symbol", "").strip()
-                    fund_name = fund.get("fund_name", "").strip()
+                    symbol = str(row.get("symbol", "")).strip()
+                    company_name = str(row.get("organ_name", "")).strip()
+                    industry = str(row.get("organ_type", "")).strip()
+                    company_type = str(row.get("com_type", "")).strip()
+                    exchange = str(row.get("exchange", "")).strip()
+                    mapped_exchange = self.exchange_mapping.get(exchange, exchange)
                     
-                    if symbol and fund_name:
+                    if symbol and company_name:
                         self.cache_manager.set_asset(
                             symbol=symbol,
-                            name=fund_name,
-                            asset_type="FUND",
-                            asset_class="Investment Fund",
-                            asset_sub_class="Mutual Fund",
-                            exchange="VN",
+                            name=company_name,
+                            asset_type="STOCK",
+                            asset_class="Equity",
+                            asset_sub_class="Stock",
+                            exchange=mapped_exchange,  # Use mapped exchange from data
                             currency="VND",
                             metadata={
-                                "listing_source": "vnstock_funds"
+                                "industry": industry,
+                                "company_type": company_type,
+                                "listing_source": "vnstock"
                             }
                         )
-                        funds_seeded += 1
+                        stocks_seeded += 1
                 except Exception as e:
-                    logger.debug(f"Error seeding fund {fund.get('symbol', 'unknown')}: {e}")
+                    logger.debug(f"Error seeding stock {row.get('symbol', 'unknown')}: {e}")
+            
+            # Update progress
+            self._seeding_progress = batch_end
+            logger.debug(f"Seeded {batch_end}/{total_stocks} stocks")
+        
+        return stocks_seeded
+    
+    async def _seed_funds(self) -> Dict[str, int]:
+        """Seed all available funds from fund API."""
+        try:
+            logger.info("Seeding funds...")
+            
+            # Get all funds (off the event loop so the other seeders overlap it)
+            funds = await asyncio.to_thread(self.fund_client.get_funds_list)
+            if not funds:
+                logger.warning("No fund data available")
+                return {'count': 0}
+            
+            funds_seeded = await asyncio.to_thread(self._store_funds, funds)
             
             logger.info(f"Successfully seeded {funds_seeded} funds")
             return {'count': int(funds_seeded)}
@@ -192,6 +187,33 @@ class DataSeeder:
             logger.error(f"Error seeding funds: {e}")
             return {'count': 0}
     
+    def _store_funds(self, funds: List[Dict]) -> int:
+        """Write the fund listing into the assets table; returns the number stored."""
+        funds_seeded = 0
+        for fund in funds:
+            try:
+                symbol = fund.get("symbol", "").strip()
+                fund_name = fund.get("fund_name", "").strip()
+                
+                if symbol and fund_name:
+                    self.cache_manager.set_asset(
+                        symbol=symbol,
+                        name=fund_name,
+                        asset_type="FUND",
+                        asset_class="Investment Fund",
+                        asset_sub_class="Mutual Fund",
+                        exchange="VN",
+                        currency="VND",
+                        metadata={
+                            "listing_source": "vnstock_funds"
+                        }
+                    )
+                    funds_seeded += 1
+            except Exception as e:
+                logger.debug(f"Error seeding fund {fund.get('symbol', 'unknown')}: {e}")
+        
+        return funds_seeded
+    
     async def _seed_indices(self) -> Dict[str, int]:
         """Seed all available indices."""
         try:
@@ -292,6 +314,20 @@ class DataSeeder:
             logger.error(f"Error seeding gold providers: {e}")
             return {'count': 0}
     
+    def _publish_asset_type_index(self):
+        """Rebuild the symbol -> asset type index from the seeded assets table."""
+        try:
+            index = {
+                sys.intern(symbol.upper()): sys.intern(asset_type.upper())
+                for symbol, asset_type in self.cache_manager.get_asset_types().items()
+            }
+            # Fixed index/gold symbols always win over seeded rows
+            index.update(SYMBOL_TO_TYPE)
+            self.asset_type_index = MappingProxyType(index)
+            logger.info(f"Published asset type index with {len(index)} symbols")
+        except Exception as e:
+            logger.error(f"Error building asset type index: {e}")
+    
     def get_seeding_progress(self) -> Dict[str, float]:
         """Get current seeding progress."""
         return {
@@ -140,8 +140,8 @@ class BaseHistoricalCacheManager:
                 ''', (symbol, asset_type, start_date, end_date))
                 
                 cached_dates = {row[0] for row in cursor.fetchall()}
-                logger.debug(f"Found {len(cached_dates)} cached dates for {symbol} "
-                           f"between {start_date} and {end_date}")
+                logger.debug("Found %s cached dates for %s between %s and %s",
+                             len(cached_dates), symbol, start_date, end_date)
                 return cached_dates
                 
             except Exception as e:
@@ -197,7 +197,7 @@ class BaseHistoricalCacheManager:
                     }
                     records.append(record)
                 
-                logger.debug(f"Retrieved {len(records)} cached records for {symbol}")
+                logger.debug("Retrieved %s cached records for %s", len(records), symbol)
                 return records
                 
             except Exception as e:
@@ -298,8 +298,7 @@ class BaseHistoricalCacheManager:
         
         missing_percentage = (total_missing_days / total_days_requested * 100) if total_days_requested > 0 else 0
         
-        logger.debug(f"Missing {total_missing_days}/{total_days_requested} days "
-                    f"({missing_percentage:.1f}%)")
+        logger.debug("Missing %s/%s days (%.1f%%)", total_missing_days, total_days_requested, missing_percentage)
         
         # If missing more than 80%, fetch everything
         return missing_percentage > 80
@@ -334,8 +333,8 @@ class BaseHistoricalCacheManager:
         sorted_records = sorted(merged.values(), 
                               key=lambda x: self._extract_date(x) or '')
         
-        logger.debug(f"Merged {len(cached_records)} cached + {len(new_records)} new "
-                    f"= {len(sorted_records)} total records")
+        logger.debug("Merged %s cached + %s new = %s total records",
+                     len(cached_records), len(new_records), len(sorted_records))
         
         return sorted_records
     
@@ -441,10 +440,10 @@ class BaseHistoricalCacheManager:
                     # Ensure symbol is in the record for API response validation
                     if 'symbol' not in record:
                         record['symbol'] = symbol
-                    logger.debug(f"Found most recent record for {symbol} dated {record.get('date')}")
+                    logger.debug("Found most recent record for %s dated %s", symbol, record.get('date'))
                     return record
                 
-                logger.debug(f"No recent records found for {symbol} in last {lookback_days} days")
+                logger.debug("No recent records found for %s in last %s days", symbol, lookback_days)
                 return None
                 
             except Exception as e:
@@ -565,7 +564,7 @@ class HistoricalCacheManager(BaseHistoricalCacheManager):
                     marked_count += 1
                 
                 conn.commit()
-                logger.debug(f"Marked {marked_count} no-data dates for {symbol} ({asset_type})")
+                logger.debug("Marked %s no-data dates for %s (%s)", marked_count, symbol, asset_type)
                 return marked_count
                 
             except Exception as e:
@@ -601,7 +600,7 @@ class StockHistoricalCacheManager(BaseHistoricalCacheManager):
         Returns:
             Number of null records created (always 0 - no placeholders)
         """
-        logger.debug(f"Stock cache: Skipping placeholder creation for {symbol} {start_date} to {end_date}")
+        logger.debug("Stock cache: Skipping placeholder creation for %s %s to %s", symbol, start_date, end_date)
         return 0
 
 
@@ -643,13 +642,13 @@ class GoldHistoricalCacheManager(BaseHistoricalCacheManager):
         Returns:
             Number of null records created (always 0 - no placeholders)
         """
-        logger.debug(f"Gold cache: Skipping placeholder creation for {symbol} {start_date} to {end_date}")
+        logger.debug("Gold cache: Skipping placeholder creation for %s %s to %s", symbol, start_date, end_date)
         
         # Trigger lazy fetch for gold if available
         if self.lazy_fetch_manager:
             try:
                 self.lazy_fetch_manager.add_lazy_fetch_task(symbol, start_date, end_date)
-                logger.debug(f"Added lazy fetch task for {symbol}")
+                logger.debug("Added lazy fetch task for %s", symbol)
             except Exception as e:
                 logger.warning(f"Failed to add lazy fetch task: {e}")
         
@@ -681,7 +680,7 @@ class FundHistoricalCacheManager(BaseHistoricalCacheManager):
         Returns:
             Number of null records created (always 0 - no placeholders)
         """
-        logger.debug(f"Fund cache: Skipping placeholder creation for {symbol} {start_date} to {end_date}")
+        logger.debug("Fund cache: Skipping placeholder creation for %s %s to %s", symbol, start_date, end_date)
         return 0
 
 
@@ -710,7 +709,7 @@ class IndexHistoricalCacheManager(BaseHistoricalCacheManager):
         Returns:
             Number of null records created (always 0 - no placeholders)
         """
-        logger.debug(f"Index cache: Skipping placeholder creation for {symbol} {start_date} to {end_date}")
+        logger.debug("Index cache: Skipping placeholder creation for %s %s to %s", symbol, start_date, end_date)
         return 0
 
 
@@ -53,7 +53,7 @@ class LazyFetchManager:
         with self._lock:
             # Check for exact duplicate
             if fetch_key in self._active_fetches:
-                logger.debug(f"Lazy fetch already active for {fetch_key}")
+                logger.debug("Lazy fetch already active for %s", fetch_key)
                 return
             
             # DISABLED: Overlap detection causes deadlocks, using basic duplicate prevention only
@@ -1,11 +1,18 @@
+import asyncio
 import time
 import threading
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Dict, Any, Optional, TypeVar
 from datetime import datetime, timedelta
 import logging
 
+from .response_cache import response_cache, symbol_search_cache
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # Import TTL manager for asset-specific TTL configuration
 try:
     from .quote_ttl_manager import get_ttl_manager
@@ -112,7 +119,7 @@ class MemoryCache:
                 self._remove_key(key)
             
             if expired_keys:
-                logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
+                logger.debug("Cleaned up %s expired cache entries", len(expired_keys))
             
             return len(expired_keys)
     
@@ -179,7 +186,7 @@ class QuoteCache(MemoryCache):
         # Use asset-specific TTL if no custom TTL provided
         if ttl is None and self._ttl_manager:
             ttl = self._ttl_manager.get_ttl_for_asset(asset_type)
-            logger.debug(f"Using asset-specific TTL for {symbol} ({asset_type}): {ttl}s")
+            logger.debug("Using asset-specific TTL for %s (%s): %ss", symbol, asset_type, ttl)
         
         self.set(key, quote_data, ttl)
     
@@ -209,10 +216,107 @@ class SearchCache(MemoryCache):
         key = f"search:{query.upper()}"
         self.set(key, results, ttl)
 
+class SingleFlight:
+    """Collapse concurrent cache-miss work for the same key into a single call."""
+    
+    def __init__(self):
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+    
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """Run fn for key, or wait for the call already in flight and share its outcome."""
+        with self._lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not is_leader:
+            return future.result()
+        
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+class AsyncSingleFlight:
+    """Event-loop counterpart of SingleFlight for coroutine fetches."""
+    
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+    
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await fn() for key, or await the call already in flight and share its outcome."""
+        task = self._inflight.get(key)
+        if task is None:
+            # The fetch runs as its own task, so it belongs to no single caller
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        # Shielded so a cancelled caller (timeout, disconnect) neither aborts the
+        # shared fetch nor makes the other callers raise CancelledError
+        return await asyncio.shield(task)
+    
+    def _finish(self, key: str, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Callers re-raise it; retrieve it here so a failure nobody waited on is not logged
+            task.exception()
+
+class RecentSymbols:
+    """Bounded, thread-safe set of keys that each expire ttl seconds after being added."""
+    
+    def __init__(self, ttl: float, max_size: int):
+        self._added_at: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.ttl = ttl
+        self.max_size = max_size
+    
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            added_at = self._added_at.get(key)
+            if added_at is None:
+                return False
+            if time.monotonic() - added_at < self.ttl:
+                return True
+            del self._added_at[key]
+            return False
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._added_at)
+    
+    def add(self, key: str) -> None:
+        """Add or refresh key, evicting the oldest entries when full."""
+        with self._lock:
+            self._added_at[key] = time.monotonic()
+            self._added_at.move_to_end(key)
+            while len(self._added_at) > self.max_size:
+                self._added_at.popitem(last=False)
+    
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._added_at.pop(key, None)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._added_at.clear()
+
 # Global cache instances
 quote_cache = QuoteCache(default_ttl=300, max_size=500)  # 5 minutes for quotes
 search_cache = SearchCache(default_ttl=1800, max_size=200)  # 30 minutes for searches
 general_cache = MemoryCache(default_ttl=600, max_size=1000)  # 10 minutes for general data
+single_flight = SingleFlight()  # Shared by response-cache refills
+async_single_flight = AsyncSingleFlight()  # Shared by async endpoint refills
 
 def cleanup_expired_caches():
     """Clean up expired entries in all caches."""
@@ -220,6 +324,8 @@ def cleanup_expired_caches():
     total_cleaned += quote_cache.cleanup_expired()
     total_cleaned += search_cache.cleanup_expired()
     total_cleaned += general_cache.cleanup_expired()
+    total_cleaned += response_cache.cleanup_expired()
+    total_cleaned += symbol_search_cache.cleanup_expired()
     
     if total_cleaned > 0:
         logger.info(f"Cleaned up {total_cleaned} expired cache entries")
@@ -229,5 +335,7 @@ def get_cache_stats() -> Dict[str, Any]:
     return {
         'quote_cache': quote_cache.get_stats(),
         'search_cache': search_cache.get_stats(),
-        'general_cache': general_cache.get_stats()
+        'general_cache': general_cache.get_stats(),
+        'response_cache': response_cache.get_stats(),
+        'symbol_search_cache': symbol_search_cache.get_stats()
     }
\ No newline at end of file
@@ -65,7 +65,7 @@ class QuoteTTLManager:
         asset_type_upper = asset_type.upper() if asset_type else 'DEFAULT'
         ttl = self.ttl_config.get(asset_type_upper, self.ttl_config['DEFAULT'])
         
-        logger.debug(f"TTL for {asset_type_upper}: {ttl} seconds")
+        logger.debug("TTL for %s: %s seconds", asset_type_upper, ttl)
         return ttl
     
     def get_ttl_for_quote(self, symbol: str, asset_type: str, 
@@ -112,8 +112,7 @@ class QuoteTTLManager:
         should_refresh = age_seconds >= ttl
         
         if should_refresh:
-            logger.debug(f"Quote for {symbol} ({asset_type}) is stale "
-                        f"(age: {age_seconds:.0f}s, TTL: {ttl}s)")
+            logger.debug("Quote for %s (%s) is stale (age: %.0fs, TTL: %ss)", symbol, asset_type, age_seconds, ttl)
         
         return should_refresh
     
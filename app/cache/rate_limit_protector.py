@@ -98,8 +98,7 @@ class RateLimitProtector:
             delay_seconds = self.config['delay_between_calls_ms'] / 1000.0
             time_since_last = now - self._last_call_time
             if self._last_call_time > 0 and time_since_last < delay_seconds:
-                logger.debug(f"Rate limit: {time_since_last:.3f}s since last call "
-                           f"(min: {delay_seconds}s)")
+                logger.debug("Rate limit: %.3fs since last call (min: %ss)", time_since_last, delay_seconds)
                 return True
             
             return False
@@ -161,8 +160,7 @@ class RateLimitProtector:
             # Clean up old timestamps
             self._cleanup_old_timestamps(now)
             
-            logger.debug(f"API call recorded ({len(self._minute_calls)}/min, "
-                        f"{len(self._hour_calls)}/hour)")
+            logger.debug("API call recorded (%s/min, %s/hour)", len(self._minute_calls), len(self._hour_calls))
     
     def _cleanup_old_timestamps(self, now: float):
         """Remove timestamps older than tracking windows."""
@@ -447,7 +445,8 @@ class RateLimitProtector:
                     if attempt < max_retries:
                         # Exponential backoff for other errors
                         backoff_time = min(2 ** attempt, 10)  # Max 10 seconds
-                        logger.debug(f"Non-rate-limit error (attempt {attempt + 1}): {e}, retrying in {backoff_time}s")
+                        logger.debug("Non-rate-limit error (attempt %s): %s, retrying in %ss",
+                                     attempt + 1, e, backoff_time)
                         time.sleep(backoff_time)
                     else:
                         logger.error(f"Failed after {max_retries + 1} attempts: {e}")
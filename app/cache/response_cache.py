@@ -0,0 +1,127 @@
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+import logging
+
+import orjson
+
+from app.config import RESPONSE_CACHE_CONFIG, SYMBOL_SEARCH_CACHE_CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+class TTLResponseCache:
+    """Short-lived cache of already-serialized JSON response bodies.
+
+    Expired bodies are kept for stale_ttl more seconds so callers can fall back
+    to them (get_stale) when rebuilding fails.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 5.0, stale_ttl: float = 0.0):
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached body for key, evicting it if expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                body, expires_at = entry
+                now = time.monotonic()
+                if now < expires_at:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return body
+                if now >= expires_at + self.stale_ttl:
+                    del self._entries[key]
+
+            self._misses += 1
+            return None
+
+    def get_stale(self, key: str) -> Optional[bytes]:
+        """Return the body for key even if expired, as long as it is within stale_ttl."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                body, expires_at = entry
+                if time.monotonic() < expires_at + self.stale_ttl:
+                    return body
+            return None
+
+    def set(self, key: str, body: bytes, ttl: Optional[float] = None) -> None:
+        """Store a serialized body under key for ttl seconds."""
+        expires_at = time.monotonic() + (ttl if ttl is not None else self.ttl)
+        with self._lock:
+            self._entries[key] = (body, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def cleanup_expired(self) -> int:
+        """Remove expired entries and return count of removed items."""
+        with self._lock:
+            now = time.monotonic()
+            expired_keys = [
+                key for key, (_, expires_at) in self._entries.items()
+                if now >= expires_at + self.stale_ttl
+            ]
+            for key in expired_keys:
+                del self._entries[key]
+            return len(expired_keys)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            total_requests = self._hits + self._misses
+            hit_rate = (self._hits / total_requests * 100) if total_requests > 0 else 0
+
+            return {
+                'size': len(self._entries),
+                'max_size': self.maxsize,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': round(hit_rate, 2),
+                'default_ttl': self.ttl,
+                'stale_ttl': self.stale_ttl
+            }
+
+
+def _json_default(value: Any) -> Any:
+    """Fallback for provider values orjson cannot serialize natively (e.g. pandas Timestamp)."""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def serialize_response(content: Any) -> bytes:
+    """Serialize a Pydantic model or plain dict to JSON bytes."""
+    if hasattr(content, "model_dump"):
+        content = content.model_dump()
+    return orjson.dumps(content, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+# Global response cache instance (per-endpoint TTLs are passed on set)
+response_cache = TTLResponseCache(
+    maxsize=RESPONSE_CACHE_CONFIG["max_size"],
+    ttl=RESPONSE_CACHE_CONFIG["quote_ttl"],
+    stale_ttl=RESPONSE_CACHE_CONFIG["stale_ttl"]
+)
+
+# Per-symbol /search/{symbol} bodies; cleared when the stock/fund listings refresh
+symbol_search_cache = TTLResponseCache(
+    maxsize=SYMBOL_SEARCH_CACHE_CONFIG["max_size"],
+    ttl=SYMBOL_SEARCH_CACHE_CONFIG["ttl_seconds"]
+)
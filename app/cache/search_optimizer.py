@@ -1,5 +1,5 @@
 import asyncio
-from typing import List, Dict, Any, Optional, Callable, Awaitable
+from typing import List, Dict, Any, Optional, Callable, Awaitable, Tuple
 import logging
 from functools import wraps
 
@@ -19,32 +19,50 @@ async def parallel_search(
     Returns:
         Combined list of search results from all functions
     """
+    combined_results, _ = await _search_within(search_functions, timeout)
+    return combined_results
+
+async def _search_within(
+    search_functions: List[Callable[[], Awaitable[List[Dict]]]],
+    timeout: float
+) -> Tuple[List[Dict], bool]:
+    """
+    Run search functions concurrently, keeping whatever finished within the timeout.
+    
+    Searches still running at the deadline are cancelled so one slow backend
+    does not discard the results of the others.
+    
+    Returns:
+        (combined results in function order, True if every search finished)
+    """
+    tasks = [asyncio.ensure_future(func()) for func in search_functions]
     try:
-        # Execute all searches concurrently with timeout
         try:
-            results = await asyncio.wait_for(
-                asyncio.gather(
-                    *[func() for func in search_functions],
-                    return_exceptions=True
-                ),
-                timeout=timeout
-            )
-        except asyncio.TimeoutError:
-            logger.error(f"Parallel search timed out after {timeout} seconds")
-            return []
+            done, pending = await asyncio.wait(tasks, timeout=timeout)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+        
+        if pending:
+            logger.warning(f"{len(pending)} of {len(tasks)} searches timed out after {timeout} seconds")
         
         combined_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.warning(f"Search function {i} failed: {result}")
+        for i, task in enumerate(tasks):
+            if task not in done:
+                continue
+            error = task.exception()
+            if error is not None:
+                logger.warning(f"Search function {i} failed: {error}")
                 continue
+            result = task.result()
             if isinstance(result, list):
                 combined_results.extend(result)
         
-        return combined_results
+        return combined_results, not pending
     except Exception as e:
         logger.error(f"Error in parallel search: {e}")
-        return []
+        return [], False
 
 def async_cache_result(cache_key_func: Callable, cache, ttl: int = 300):
     """
@@ -64,14 +82,14 @@ def async_cache_result(cache_key_func: Callable, cache, ttl: int = 300):
             # Try to get from cache first
             cached_result = cache.get(cache_key)
             if cached_result is not None:
-                logger.debug(f"Cache hit for key: {cache_key}")
+                logger.debug("Cache hit for key: %s", cache_key)
                 return cached_result
             
             # Execute function and cache result
             try:
                 result = await func(*args, **kwargs)
                 cache.set(cache_key, result, ttl)
-                logger.debug(f"Cached result for key: {cache_key}")
+                logger.debug("Cached result for key: %s", cache_key)
                 return result
             except Exception as e:
                 logger.error(f"Error executing {func.__name__}: {e}")
@@ -135,7 +153,7 @@ class SearchOptimizer:
         search_functions: Dict[str, Callable[[], Awaitable[List[Dict]]]],
         limit: int = 20,
         use_cache: bool = True
-    ) -> List[Dict]:
+    ) -> Tuple[List[Dict], bool]:
         """
         Perform optimized search with caching and parallel execution.
         
@@ -146,27 +164,28 @@ class SearchOptimizer:
             use_cache: Whether to use cached results
             
         Returns:
-            Combined and ranked search results
+            (combined and ranked search results, False if a backend timed out and
+            the results are partial)
         """
         # Check cache first
         if use_cache:
             cached_results = self.memory_cache.get_search_results(query)
             if cached_results:
-                logger.debug(f"Using cached search results for '{query}'")
-                return cached_results[:limit]
+                logger.debug("Using cached search results for '%s'", query)
+                return cached_results[:limit], True
         
-        # Check persistent cache
+        # Check persistent cache (SQLite, so kept off the event loop)
         if use_cache:
-            persistent_results = self.cache_manager.get_search_results(query)
+            persistent_results = await asyncio.to_thread(self.cache_manager.get_search_results, query)
             if persistent_results:
-                logger.debug(f"Using persistent cached search results for '{query}'")
+                logger.debug("Using persistent cached search results for '%s'", query)
                 # Also store in memory cache for faster access
                 self.memory_cache.set_search_results(query, persistent_results)
-                return persistent_results[:limit]
+                return persistent_results[:limit], True
         
         # Execute searches in parallel
         search_tasks = list(search_functions.values())
-        combined_results = await parallel_search(search_tasks)
+        combined_results, complete = await _search_within(search_tasks, timeout=5.0)
         
         # Remove duplicates and rank results
         unique_results = self._deduplicate_and_rank(combined_results, query)
@@ -174,12 +193,12 @@ class SearchOptimizer:
         # Limit results
         final_results = unique_results[:limit]
         
-        # Cache results
-        if use_cache and final_results:
+        # Cache results; a partial set (some backend timed out) is returned but not remembered
+        if use_cache and final_results and complete:
             self.memory_cache.set_search_results(query, final_results)
-            self.cache_manager.set_search_results(query, final_results)
+            await asyncio.to_thread(self.cache_manager.set_search_results, query, final_results)
         
-        return final_results
+        return final_results, complete
     
     def _deduplicate_and_rank(self, results: List[Dict], query: str) -> List[Dict]:
         """
@@ -193,30 +212,18 @@ class SearchOptimizer:
             Deduplicated and ranked results
         """
         query_upper = query.upper()
-        seen = set()
-        unique_results = []
         
+        # First occurrence of each (symbol, asset_type) wins; dicts keep insertion order
+        unique = {}
         for result in results:
-            # Create unique key
-            key = (result.get('symbol', ''), result.get('asset_type', ''))
-            if key in seen:
-                continue
-            
-            seen.add(key)
-            
-            # Calculate relevance score
-            score = self._calculate_relevance_score(result, query_upper)
-            result['_relevance_score'] = score
-            unique_results.append(result)
-        
-        # Sort by relevance score (descending)
-        unique_results.sort(key=lambda x: x.get('_relevance_score', 0), reverse=True)
-        
-        # Remove internal score field
-        for result in unique_results:
-            result.pop('_relevance_score', None)
+            unique.setdefault((result.get('symbol', ''), result.get('asset_type', '')), result)
         
-        return unique_results
+        # Sort by relevance score (descending); the stable sort keeps source order on ties
+        return sorted(
+            unique.values(),
+            key=lambda result: self._calculate_relevance_score(result, query_upper),
+            reverse=True
+        )
     
     def _calculate_relevance_score(self, result: Dict, query: str) -> float:
         """
@@ -1,6 +1,6 @@
 from vnstock import Fund
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, FrozenSet, Tuple
 import logging
 import pandas as pd
 import time
@@ -9,6 +9,8 @@ from vnstock.core.utils import client
 from vnstock.core.utils.user_agent import get_headers
 from app.cache import get_fund_historical_cache, get_rate_limiter, get_ttl_manager
 from app.utils.provider_logger import log_provider_call
+from app.utils.response_validator import ResponseValidator
+from app.constants import ASSET_TYPE_FUND
 
 # Import LazyFetchManager separately to avoid circular import issues
 try:
@@ -24,8 +26,14 @@ class FundClient:
     def __init__(self, cache_manager=None, memory_cache=None):
         self._funds_cache: Optional[List[Dict]] = None
         self._funds_map: Dict[str, int] = {}
-        self._cache_timestamp: Optional[datetime] = None
+        self._fund_symbols: FrozenSet[str] = frozenset()
+        self._funds_by_symbol: Dict[str, Dict] = {}
+        # (symbol lower, fund name lower, listing entry) per fund, for substring search
+        self._fund_search_keys: List[Tuple[str, str, Dict]] = []
+        self._validated_funds: List[Dict] = []
         self._cache_duration = timedelta(hours=24)
+        # Monotonic deadline for the listing; checked on every fund routing decision
+        self._cache_expires_at = 0.0
         self._fund_api = None  # Lazy initialization
         self.cache_manager = cache_manager
         self.memory_cache = memory_cache
@@ -87,9 +95,7 @@ class FundClient:
             return False
 
     def _is_cache_valid(self) -> bool:
-        if self._cache_timestamp is None:
-            return False
-        return datetime.now() - self._cache_timestamp < self._cache_duration
+        return time.monotonic() < self._cache_expires_at
     
     def _get_fund_inception_date(self, symbol: str) -> Optional[str]:
         """
@@ -100,7 +106,7 @@ class FundClient:
         """
         # Check cache first
         if symbol.upper() in self._inception_dates:
-            logger.debug(f"Using cached inception date for {symbol}: {self._inception_dates[symbol.upper()]}")
+            logger.debug("Using cached inception date for %s: %s", symbol, self._inception_dates[symbol.upper()])
             return self._inception_dates[symbol.upper()]
         
         try:
@@ -256,7 +262,13 @@ class FundClient:
                         self._funds_map[short_name.upper()] = fund_id
                 
                 self._funds_cache = funds
-                self._cache_timestamp = datetime.now()
+                self._fund_symbols = frozenset(f["symbol"] for f in funds)
+                self._funds_by_symbol = {f["symbol"].upper(): f for f in funds}
+                self._fund_search_keys = [
+                    (str(f["symbol"]).lower(), str(f["fund_name"] or "").lower(), f) for f in funds
+                ]
+                self._validated_funds = self._build_validated_funds(funds)
+                self._cache_expires_at = time.monotonic() + self._cache_duration.total_seconds()
                 logger.info(f"Cached {len(funds)} funds successfully")
                 return
                 
@@ -290,6 +302,47 @@ class FundClient:
                 return self._funds_cache
             raise
     
+    def refresh_funds_list(self) -> List[Dict]:
+        """Reload the fund listing and derived symbol set ahead of cache expiry, keeping the old copy on failure."""
+        try:
+            self._refresh_funds_cache()
+        except Exception as e:
+            logger.error(f"Error refreshing funds list: {e}")
+        return self._funds_cache if self._funds_cache else []
+
+    @staticmethod
+    def _build_validated_funds(funds: List[Dict]) -> List[Dict]:
+        """Shape and validate the /funds listing once per fund cache refresh."""
+        validated_funds = []
+        for f in funds:
+            fund_dict = ResponseValidator.enrich_response_with_classification({
+                "symbol": f["symbol"],
+                "fund_name": f["fund_name"],
+                "asset_type": f["asset_type"]
+            }, ASSET_TYPE_FUND)
+
+            if not ResponseValidator.validate_response_fields(fund_dict, ASSET_TYPE_FUND):
+                logger.warning(f"Validation failed for fund list item {f['symbol']}")
+            validated_funds.append(fund_dict)
+        return validated_funds
+
+    def get_validated_funds_list(self) -> List[Dict]:
+        """Return the classified fund listing, validated when the cache was last loaded."""
+        self.get_funds_list()
+        return self._validated_funds
+
+    def get_fund_symbols(self) -> FrozenSet[str]:
+        """Return the set of listed fund symbols for O(1) membership checks."""
+        if not (self._is_cache_valid() and self._funds_cache):
+            self.get_funds_list()
+        return self._fund_symbols
+
+    def get_fund_listing(self, symbol: str) -> Optional[Dict]:
+        """Return the cached listing entry (symbol, fund_name) for a fund without a provider call."""
+        if not (self._is_cache_valid() and self._funds_cache):
+            self.get_funds_list()
+        return self._funds_by_symbol.get(symbol.upper())
+    
     def _get_fund_id(self, symbol: str) -> Optional[int]:
         if not self._is_cache_valid() or not self._funds_map:
             try:
@@ -314,12 +367,8 @@ class FundClient:
             info = fund_info.iloc[-1]
             nav_value = info.get("nav_per_unit", 0.0)
             
-            fund_name = symbol
-            if self._funds_cache:
-                for fund in self._funds_cache:
-                    if fund.get("symbol", "").upper() == symbol.upper():
-                        fund_name = fund.get("fund_name", symbol)
-                        break
+            listing = self._funds_by_symbol.get(symbol.upper())
+            fund_name = listing.get("fund_name", symbol) if listing else symbol
             
             result = {
                 "symbol": symbol,
@@ -665,14 +714,14 @@ class FundClient:
         if self.memory_cache:
             cached_quote = self.memory_cache.get_quote(symbol, "FUND")
             if cached_quote:
-                logger.debug(f"Using cached NAV for {symbol}")
+                logger.debug("Using cached NAV for %s", symbol)
                 return cached_quote
         
         # Check persistent cache
         if self.cache_manager:
             cached_quote = self.cache_manager.get_quote(symbol, "FUND")
             if cached_quote:
-                logger.debug(f"Using persistent cached NAV for {symbol}")
+                logger.debug("Using persistent cached NAV for %s", symbol)
                 # Also store in memory cache for faster access (will use 24-hour TTL)
                 if self.memory_cache:
                     self.memory_cache.set_quote(symbol, "FUND", cached_quote)
@@ -692,7 +741,7 @@ class FundClient:
                 fund_api = self._fund_api  # Local variable for type checker
                 nav_df = fund_api.nav_report(fund_id)
                 if nav_df is None or nav_df.empty:
-                    logger.debug(f"No current NAV data for {symbol}, checking historical fallback")
+                    logger.debug("No current NAV data for %s, checking historical fallback", symbol)
                     
                     # Fallback 1: Check historical cache for most recent record
                     if self.historical_cache:
@@ -776,19 +825,18 @@ class FundClient:
     def search_funds_by_name(self, query: str, limit: int = 10) -> List[Dict]:
         """Search funds by partial name or symbol match (case-insensitive)."""
         try:
-            funds = self.get_funds_list()
+            if not (self._is_cache_valid() and self._funds_cache):
+                self.get_funds_list()
             query_lower = query.lower()
             results = []
             
-            for fund in funds:
-                symbol = fund.get("symbol", "")
-                fund_name = fund.get("fund_name", "")
-                
+            # Lower-cased keys are computed once per listing refresh
+            for symbol_lower, name_lower, fund in self._fund_search_keys:
                 # Match on symbol or fund name
-                if query_lower in symbol.lower() or query_lower in fund_name.lower():
+                if query_lower in symbol_lower or query_lower in name_lower:
                     results.append({
-                        "symbol": symbol,
-                        "fund_name": fund_name,
+                        "symbol": fund["symbol"],
+                        "fund_name": fund["fund_name"],
                         "asset_type": "MUTUAL_FUND"
                     })
                     if len(results) >= limit:
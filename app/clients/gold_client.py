@@ -27,6 +27,13 @@ class GoldClient:
             "api_func": "sjc_gold_price"
         }
     }
+
+    # Upper-cased symbol -> provider, for constant-time symbol matching
+    _SYMBOL_TO_PROVIDER = {
+        symbol.upper(): provider
+        for provider, config in PROVIDERS.items()
+        for symbol in config["symbols"]
+    }
     
     def __init__(self, cache_manager=None, memory_cache=None, db_path: str = "db/assets.db"):
         self.cache_manager = cache_manager
@@ -55,19 +62,28 @@ class GoldClient:
     
     
     
+    def match_symbol(self, symbol: str) -> Optional[Tuple[str, str]]:
+        """
+        Return (normalized_symbol, provider) for a gold provider symbol, or None.
+        Lets callers reject non-gold symbols without raising.
+        """
+        symbol_upper = symbol.upper()
+        provider = self._SYMBOL_TO_PROVIDER.get(symbol_upper)
+        if provider is None:
+            return None
+        # Normalize to base symbol for data fetching (always use VN.GOLD for storage)
+        normalized_symbol = "VN.GOLD" if symbol_upper.endswith('.C') else symbol_upper
+        return normalized_symbol, provider
+
     def parse_symbol(self, symbol: str) -> Tuple[str, str]:
         """
         Parse gold symbol and return (normalized_symbol, provider).
         Supports VN.GOLD (Lượng) and VN.GOLD.C (Chỉ) symbols.
         Raises ValueError if symbol is not a valid gold provider symbol.
         """
-        symbol_upper = symbol.upper()
-        
-        for provider, config in self.PROVIDERS.items():
-            if symbol_upper in [s.upper() for s in config["symbols"]]:
-                # Normalize to base symbol for data fetching (always use VN.GOLD for storage)
-                normalized_symbol = "VN.GOLD" if symbol_upper.endswith('.C') else symbol_upper
-                return normalized_symbol, provider
+        match = self.match_symbol(symbol)
+        if match is not None:
+            return match
         
         raise ValueError(f"Invalid gold symbol: {symbol}. Valid symbols: {self._get_all_valid_symbols()}")
     
@@ -209,7 +225,7 @@ class GoldClient:
                 
                 # Consider complete if we have at least 80% of expected trading days
                 completeness = actual_days / expected_days if expected_days > 0 else 0
-                logger.debug(f"Database completeness: {actual_days}/{expected_days} ({completeness:.1%})")
+                logger.debug("Database completeness: %s/%s (%.1f%%)", actual_days, expected_days, completeness * 100)
                 
                 return completeness >= 0.8
                 
@@ -219,9 +235,13 @@ class GoldClient:
     
     def get_gold_history(self, symbol: str, start_date: str, end_date: str) -> List[Dict]:
         """Fetch historical gold prices using lazy fetch approach - return cached data immediately."""
+        match = self.match_symbol(symbol)
+        if match is None:
+            logger.debug("Invalid gold symbol: %s", symbol)
+            return []
+        normalized_symbol, provider = match
+
         try:
-            normalized_symbol, provider = self.parse_symbol(symbol)
-            
             # Only SJC provider supported
             if provider != "sjc":
                 logger.error(f"Unsupported provider: {provider}. Only SJC is supported.")
@@ -230,9 +250,6 @@ class GoldClient:
             # LAZY FETCH: Return cached data immediately
             return self._get_history_lazy_fetch(normalized_symbol, symbol, start_date, end_date)
             
-        except ValueError as e:
-            logger.debug(f"Invalid symbol: {e}")
-            return []
         except Exception as e:
             logger.error(f"Error fetching gold history for {symbol}: {e}")
             return []
@@ -318,7 +335,7 @@ class GoldClient:
         # Quick check: Is this range already being fetched?
         fetch_key = f"{symbol}_{start_date}_{end_date}"
         if fetch_key in self.lazy_fetch_manager._active_fetches:
-            logger.debug(f"Lazy fetch already active for {fetch_key}")
+            logger.debug("Lazy fetch already active for %s", fetch_key)
             return False
             
         # DISABLED: Overlap detection causes deadlocks, using basic duplicate prevention only
@@ -481,11 +498,11 @@ class GoldClient:
     
     def get_latest_quote(self, symbol: str) -> Optional[Dict]:
         """Fetch the latest gold price using database-first approach with unit conversion."""
-        try:
-            normalized_symbol, provider = self.parse_symbol(symbol)
-        except ValueError as e:
-            logger.debug(f"Invalid symbol: {e}")
+        match = self.match_symbol(symbol)
+        if match is None:
+            logger.debug("Invalid gold symbol: %s", symbol)
             return None
+        normalized_symbol, provider = match
         
         # Only SJC provider supported
         if provider != "sjc":
@@ -517,20 +534,20 @@ class GoldClient:
                 
                 return quote_data
             else:
-                logger.debug(f"Database data for {symbol} is {days_old} days old, fetching fresh data")
+                logger.debug("Database data for %s is %s days old, fetching fresh data", symbol, days_old)
         
         # FALLBACK 1: Check memory cache
         if self.memory_cache:
             cached_quote = self.memory_cache.get_quote(symbol, "GOLD")
             if cached_quote:
-                logger.debug(f"Using memory cached gold quote for {symbol}")
+                logger.debug("Using memory cached gold quote for %s", symbol)
                 return cached_quote
         
         # FALLBACK 2: Check persistent cache
         if self.cache_manager:
             cached_quote = self.cache_manager.get_quote(symbol, "GOLD")
             if cached_quote:
-                logger.debug(f"Using persistent cached gold quote for {symbol}")
+                logger.debug("Using persistent cached gold quote for %s", symbol)
                 # Also store in memory cache for faster access
                 if self.memory_cache:
                     self.memory_cache.set_quote(symbol, "GOLD", cached_quote)
@@ -557,7 +574,7 @@ class GoldClient:
         
         # If API failed, try historical fallback
         if not quote_data:
-            logger.debug(f"No current data for gold {symbol}, checking historical fallback")
+            logger.debug("No current data for gold %s, checking historical fallback", symbol)
             
             # Fallback: Check historical cache for most recent record
             if self.historical_cache:
@@ -634,8 +651,13 @@ class GoldClient:
     
     def search_gold(self, symbol: str) -> Optional[Dict]:
         """Return gold asset information for search results with unit information."""
+        match = self.match_symbol(symbol)
+        if match is None:
+            logger.debug("Invalid gold symbol: %s", symbol)
+            return None
+
         try:
-            normalized_symbol, provider = self.parse_symbol(symbol)
+            normalized_symbol, provider = match
             config = self.PROVIDERS[provider]
             
             # Determine unit and description
@@ -659,9 +681,6 @@ class GoldClient:
                 "unit": unit,
                 "unit_description": unit_description
             }
-        except ValueError as e:
-            logger.debug(f"Invalid symbol: {e}")
-            return None
         except Exception as e:
             logger.error(f"Error searching gold: {e}")
             return None
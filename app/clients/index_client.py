@@ -146,14 +146,14 @@ class IndexClient:
         if self.memory_cache:
             cached_quote = self.memory_cache.get_quote(symbol, "INDEX")
             if cached_quote:
-                logger.debug(f"Using cached index quote for {symbol}")
+                logger.debug("Using cached index quote for %s", symbol)
                 return cached_quote
         
         # Check persistent cache
         if self.cache_manager:
             cached_quote = self.cache_manager.get_quote(symbol, "INDEX")
             if cached_quote:
-                logger.debug(f"Using persistent cached index quote for {symbol}")
+                logger.debug("Using persistent cached index quote for %s", symbol)
                 # Also store in memory cache for faster access (will use 1-hour TTL)
                 if self.memory_cache:
                     self.memory_cache.set_quote(symbol, "INDEX", cached_quote)
@@ -187,7 +187,7 @@ class IndexClient:
         
         # Check if we got valid data, otherwise use fallback
         if quote_df is None or quote_df.empty:
-            logger.debug(f"No current data for index {symbol}, checking historical fallback")
+            logger.debug("No current data for index %s, checking historical fallback", symbol)
             
             # Fallback 1: Check historical cache for most recent record
             if self.historical_cache:
@@ -1,11 +1,18 @@
 from vnstock import Quote, Listing
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterator, Tuple
+from collections import OrderedDict
 import logging
 import pandas as pd
 import sys
 import os
+import threading
+import time
+from app.config import NEGATIVE_CACHE_CONFIG, HISTORICAL_CACHE_CONFIG, COMPANIES_CACHE_CONFIG
 from app.utils.provider_logger import log_provider_call
+from app.utils.numeric_kernels import scale_ohlcv
+from app.utils.date_utils import today_str, days_before
+from app.cache.memory_cache import RecentSymbols
 
 # Add current directory to Python path for imports
 current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -29,6 +36,7 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+
 class StockClient:
     def __init__(self, cache_manager=None, memory_cache=None):
         self._quote = None
@@ -37,6 +45,29 @@ class StockClient:
         self.memory_cache = memory_cache
         self._companies_cache = None
         self._cache_timestamp = None
+        self._companies_cache_path = COMPANIES_CACHE_CONFIG["path"]
+        self._companies_cache_ttl = COMPANIES_CACHE_CONFIG["ttl_seconds"]
+        # (listing DataFrame, symbol -> row position) for the listing last indexed
+        self._symbol_positions: Tuple[Optional[pd.DataFrame], Dict[str, int]] = (None, {})
+        
+        # Negative caches of confirmed misses, kept apart so a symbol absent from the
+        # filtered STOCK listing (ETF, CW, new listing) can still be quoted
+        self._missing_listings = RecentSymbols(NEGATIVE_CACHE_CONFIG["ttl_seconds"], NEGATIVE_CACHE_CONFIG["max_size"])
+        self._missing_quotes = RecentSymbols(NEGATIVE_CACHE_CONFIG["ttl_seconds"], NEGATIVE_CACHE_CONFIG["max_size"])
+        
+        # Reused vnstock Quote objects per symbol (bounded LRU). A Quote only reads
+        # the symbol, headers and proxy settings fixed at construction, so one
+        # instance can serve concurrent requests; the LRU bookkeeping is locked
+        self._quote_by_symbol: OrderedDict[str, Quote] = OrderedDict()
+        self._quote_pool_size = 256
+        self._quote_lock = threading.Lock()
+        
+        # Freshness gate: symbols whose latest data was checked within the interval
+        self._recently_checked = RecentSymbols(
+            HISTORICAL_CACHE_CONFIG["freshness_check_interval"],
+            HISTORICAL_CACHE_CONFIG["freshness_max_tracked"]
+        )
+        self._update_threshold_minutes = HISTORICAL_CACHE_CONFIG["update_threshold_minutes"]
         
         # Initialize smart caching components
         if _has_smart_cache:
@@ -55,10 +86,42 @@ class StockClient:
             'UPCOM': 'UPCOM' # Unlisted Public Company Market
         }
     
+    def _company_position(self, companies_df: pd.DataFrame, symbol: str) -> Optional[int]:
+        """Return the row position of symbol in the listing via a hash index built once per listing."""
+        indexed_df, positions = self._symbol_positions
+        if indexed_df is not companies_df:
+            positions = {}
+            for position, listed_symbol in enumerate(companies_df['symbol']):
+                positions.setdefault(listed_symbol, position)
+            # Single assignment so concurrent readers never pair a listing with another's index
+            self._symbol_positions = (companies_df, positions)
+        return positions.get(symbol)
+    
+    def _listing_reloaded(self):
+        """Forget remembered misses once a new listing may contain them."""
+        self._missing_listings.clear()
+        self._missing_quotes.clear()
+    
+    def _get_quote(self, symbol: str) -> Quote:
+        """Return a cached vnstock Quote for symbol, creating it on first use."""
+        with self._quote_lock:
+            quote = self._quote_by_symbol.get(symbol)
+            if quote is not None:
+                self._quote_by_symbol.move_to_end(symbol)
+                return quote
+        
+        # Built outside the lock; if another thread raced us, keep its instance
+        quote = Quote(symbol=symbol, source='VCI')
+        with self._quote_lock:
+            quote = self._quote_by_symbol.setdefault(symbol, quote)
+            self._quote_by_symbol.move_to_end(symbol)
+            while len(self._quote_by_symbol) > self._quote_pool_size:
+                self._quote_by_symbol.popitem(last=False)
+        return quote
+    
     @log_provider_call(provider_name="vnstock", metadata_fields={"symbol": lambda r: r[0].get("symbol") if r else None})
     def _fetch_stock_history_from_provider(self, symbol: str, start_date: str, end_date: str) -> List[Dict]:
-        quote = Quote(symbol=symbol, source='VCI')
-        history_df = quote.history(start=start_date, end=end_date)
+        history_df = self._get_quote(symbol).history(start=start_date, end=end_date)
         return history_df
 
     def _check_and_update_latest_price_fallback(self, symbol: str, cached_data: List[Dict]):
@@ -67,24 +130,25 @@ class StockClient:
             return
         
         now = datetime.now()
-        latest_record = cached_data[-1]  # Most recent
+        weekday_now = now.weekday() < 5  # Monday=0, Friday=4
+        latest_date = cached_data[-1]['date']  # Most recent
         
         # Simple weekday/weekend logic without shared utils
-        if now.weekday() < 5:  # Monday=0, Friday=4
-            # Weekday: Update if older than 30 minutes
+        if weekday_now:
+            # Weekday: Update if older than the configured threshold
             try:
-                last_update = datetime.strptime(latest_record['date'], "%Y-%m-%d")
-                if len(latest_record['date']) == 10:  # YYYY-MM-DD format
+                last_update = datetime.fromisoformat(latest_date)
+                if len(latest_date) == 10:  # YYYY-MM-DD format
                     last_update = last_update.replace(hour=23, minute=59, second=59)
                 
-                if (now - last_update).total_seconds() > (30 * 60):
+                if (now - last_update).total_seconds() > (self._update_threshold_minutes * 60):
                     self._fetch_and_store_latest_price_fallback(symbol, now)
             except ValueError:
                 self._fetch_and_store_latest_price_fallback(symbol, now)
         else:
             # Weekend: Ensure Friday data
             try:
-                last_date = datetime.strptime(latest_record['date'], "%Y-%m-%d")
+                last_date = datetime.fromisoformat(latest_date)
                 if last_date.weekday() != 4:  # Not Friday
                     self._fetch_and_store_friday_price_fallback(symbol, now)
             except ValueError:
@@ -127,6 +191,11 @@ class StockClient:
                 cached_data = self.historical_cache.get_cached_records(symbol, start_date, end_date, 'STOCK')
                 
                 if cached_data:
+                    # Skip the freshness check if this symbol was checked recently
+                    if symbol in self._recently_checked:
+                        return cached_data
+                    self._recently_checked.add(symbol)
+                    
                     # 2. Check latest price update using shared utility
                     if _has_shared_utils:
                         check_and_update_latest_data(
@@ -134,7 +203,7 @@ class StockClient:
                             asset_type='STOCK',
                             cached_data=cached_data,
                             client_instance=self,
-                            update_threshold_minutes=30
+                            update_threshold_minutes=self._update_threshold_minutes
                         )
                     else:
                         # Fallback: Simple latest price check without shared utils
@@ -210,65 +279,93 @@ class StockClient:
     
     def _fetch_stock_history_raw(self, symbol: str, start_date: str, end_date: str) -> List[Dict]:
         """Fetch stock history from API without caching logic."""
+        return list(self._iter_stock_history_raw(symbol, start_date, end_date))
+    
+    def _iter_stock_history_raw(self, symbol: str, start_date: str, end_date: str) -> Iterator[Dict]:
+        """Lazily yield stock history records from the API without caching logic."""
         try:
             history_df = self._fetch_stock_history_from_provider(symbol, start_date, end_date)
-            
-            if history_df is None or history_df.empty:
-                return []
-            
-            history = []
-            for _, row in history_df.iterrows():
-                date_val = row.get("time") or row.get("tradingDate")
-                if pd.isna(date_val):
-                    continue
-                    
-                date_str = date_val.strftime("%Y-%m-%d") if isinstance(date_val, pd.Timestamp) else str(date_val)
-                
-                # Convert from shortened VND format (e.g., 12) to actual VND (e.g., 12000)
-                open_val = float(row.get("open", 0.0)) * 1000 if not pd.isna(row.get("open")) else 0.0
-                high_val = float(row.get("high", 0.0)) * 1000 if not pd.isna(row.get("high")) else 0.0
-                low_val = float(row.get("low", 0.0)) * 1000 if not pd.isna(row.get("low")) else 0.0
-                close_val = float(row.get("close", 0.0)) * 1000 if not pd.isna(row.get("close")) else 0.0
-                volume_val = float(row.get("volume", 0.0)) if not pd.isna(row.get("volume")) else 0.0
-                
-                history.append({
-                    "symbol": symbol,
-                    "date": date_str,
-                    "nav": close_val,
-                    "open": open_val,
-                    "high": high_val,
-                    "low": low_val,
-                    "close": close_val,
-                    "adjclose": close_val,
-                    "volume": volume_val
-                })
-            
-            return history
+            yield from self._iter_history_rows(symbol, history_df)
         except Exception as e:
             logger.error(f"Error fetching stock history for {symbol}: {e}")
-            return []
+    
+    def _iter_history_rows(self, symbol: str, history_df: Optional[pd.DataFrame]) -> Iterator[Dict]:
+        """Convert a provider history DataFrame into record dicts."""
+        if history_df is None or history_df.empty:
+            return
+        
+        # Rows without a trading date are unusable; drop them in one pass
+        date_col = "time" if "time" in history_df.columns else "tradingDate"
+        if date_col not in history_df.columns:
+            return
+        history_df = history_df.dropna(subset=[date_col])
+        
+        # Convert from shortened VND format (e.g., 12) to actual VND (e.g., 12000)
+        # for all rows at once; NaN prices and volumes become 0.0
+        prices, volumes = scale_ohlcv(history_df, price_scale=1000.0)
+        
+        # Share one symbol string across every row of this response
+        sym = sys.intern(symbol)
+        for date_val, (open_val, high_val, low_val, close_val), volume_val in zip(history_df[date_col], prices.tolist(), volumes.tolist()):
+            date_str = date_val.strftime("%Y-%m-%d") if isinstance(date_val, pd.Timestamp) else str(date_val)
+            
+            yield {
+                "symbol": sym,
+                "date": date_str,
+                "nav": close_val,
+                "open": open_val,
+                "high": high_val,
+                "low": low_val,
+                "close": close_val,
+                "adjclose": close_val,
+                "volume": volume_val
+            }
     
     @log_provider_call(provider_name="vnstock", metadata_fields={"symbol": lambda r: r.get("symbol") if isinstance(r, dict) else None})
     def _fetch_latest_quote_from_provider(self, symbol: str) -> Optional[Dict]:
-        today = datetime.now().strftime("%Y-%m-%d")
-        quote = Quote(symbol=symbol, source='VCI')
-        quote_df = quote.history(start=today, end=today)
+        today = today_str()
+        quote_df = self._get_quote(symbol).history(start=today, end=today)
         return quote_df
     
+    def _find_recent_trading_record(self, symbol: str, days_back: int = 7) -> Optional[Dict]:
+        """Fetch the last week of history in one provider call and return its latest record.
+        
+        Provider errors propagate so callers can tell a failed lookup from an empty one.
+        """
+        today = today_str()
+        if self.rate_limiter:
+            self.rate_limiter.wait_for_slot()
+        
+        history_df = self._fetch_stock_history_from_provider(symbol, days_before(today, days_back), today)
+        records = list(self._iter_history_rows(symbol, history_df))
+        if not records:
+            return None
+        
+        if self.historical_cache:
+            try:
+                self.historical_cache.store_historical_records(symbol, 'STOCK', records)
+            except Exception as e:
+                logger.warning(f"Failed to store last week's data in cache: {e}")
+        return records[-1]
+    
     def get_latest_quote(self, symbol: str) -> Optional[Dict]:
         """Get latest stock quote with asset-specific TTL and rate limiting."""
+        if symbol in self._missing_quotes:
+            logger.debug("Skipping quote lookup for known-missing symbol %s", symbol)
+            return None
+        
         # Check memory cache first (now uses 1-hour TTL for stocks)
         if self.memory_cache:
             cached_quote = self.memory_cache.get_quote(symbol, "STOCK")
             if cached_quote:
-                logger.debug(f"Using cached quote for {symbol}")
+                logger.debug("Using cached quote for %s", symbol)
                 return cached_quote
         
         # Check persistent cache
         if self.cache_manager:
             cached_quote = self.cache_manager.get_quote(symbol, "STOCK")
             if cached_quote:
-                logger.debug(f"Using persistent cached quote for {symbol}")
+                logger.debug("Using persistent cached quote for %s", symbol)
                 # Also store in memory cache for faster access (will use 1-hour TTL)
                 if self.memory_cache:
                     self.memory_cache.set_quote(symbol, "STOCK", cached_quote)
@@ -280,7 +377,7 @@ class StockClient:
         
         # Try to fetch current quote, catch API exceptions separately
         quote_df = None
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = today_str()
         
         # Apply rate limiting before API call
         if self.rate_limiter:
@@ -288,8 +385,9 @@ class StockClient:
         
         # Try to fetch current quote, catch API exceptions separately
         quote_df = None
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = today_str()
         
+        provider_failed = False
         try:
             quote_df = self._fetch_latest_quote_from_provider(symbol)
             
@@ -299,10 +397,11 @@ class StockClient:
         except Exception as e:
             logger.warning(f"API call failed for {symbol}: {e}, will try fallback")
             quote_df = None
+            provider_failed = True
         
         # Check if we got valid data, otherwise use fallback
         if quote_df is None or quote_df.empty:
-            logger.debug(f"No current data for {symbol}, checking historical fallback")
+            logger.debug("No current data for %s, checking historical fallback", symbol)
             
             # Fallback 1: Check historical cache for most recent record
             if self.historical_cache:
@@ -319,16 +418,15 @@ class StockClient:
                 
                 # Fallback 2: Fetch last week's data to populate cache
                 logger.info(f"No historical cache for {symbol}, fetching last week's data")
-                one_week_ago = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
-                today_str = datetime.now().strftime("%Y-%m-%d")
-                history = self.get_stock_history(symbol, one_week_ago, today_str)
+                try:
+                    most_recent = self._find_recent_trading_record(symbol)
+                except Exception as e:
+                    logger.warning(f"Last-week fallback failed for {symbol}: {e}")
+                    most_recent = None
+                    provider_failed = True
                 
-                if history:
-                    most_recent = history[-1]
-                    # Ensure symbol is in the record
-                    if 'symbol' not in most_recent:
-                        most_recent['symbol'] = symbol
-                    logger.info(f"Using last week's most recent data for {symbol} from {most_recent.get('date')}")
+                if most_recent:
+                    logger.info(f"Using most recent trading day for {symbol} from {most_recent.get('date')}")
                     # Cache this fallback quote
                     if self.memory_cache:
                         self.memory_cache.set_quote(symbol, "STOCK", most_recent)
@@ -337,6 +435,10 @@ class StockClient:
                         self.cache_manager.set_quote(symbol, "STOCK", most_recent, ttl_seconds=ttl)
                     return most_recent
             
+            # Only an answered-but-empty lookup confirms the symbol is unknown;
+            # timeouts and rate-limit errors must not turn into cached 404s
+            if not provider_failed:
+                self._missing_quotes.add(symbol)
             return None
         
         # Process successful API response
@@ -387,30 +489,74 @@ class StockClient:
     def _fetch_companies_from_provider(self) -> Optional[pd.DataFrame]:
         return self._listing.symbols_by_exchange()
     
+    def _load_companies_from_disk(self, current_time: float) -> Optional[pd.DataFrame]:
+        """Load the persisted companies listing if it is still fresh."""
+        try:
+            mtime = os.path.getmtime(self._companies_cache_path)
+        except OSError:
+            return None
+        
+        if current_time - mtime >= self._companies_cache_ttl:
+            return None
+        
+        try:
+            # JSON rather than pickle: the path is env-configurable and unpickling can run code
+            companies_df = pd.read_json(self._companies_cache_path, orient="records", dtype=False, convert_dates=False)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable companies cache file {self._companies_cache_path}: {e}")
+            return None
+        
+        self._companies_cache = companies_df
+        self._cache_timestamp = mtime
+        self._listing_reloaded()
+        logger.info(f"Loaded companies cache from disk: {len(companies_df)} active stocks")
+        return companies_df
+    
+    def _save_companies_to_disk(self, companies_df: pd.DataFrame):
+        """Persist the filtered companies listing for reuse across restarts."""
+        try:
+            os.makedirs(os.path.dirname(self._companies_cache_path) or ".", exist_ok=True)
+            companies_df.to_json(self._companies_cache_path, orient="records", force_ascii=False)
+        except Exception as e:
+            logger.warning(f"Could not persist companies cache to {self._companies_cache_path}: {e}")
+    
     def _get_companies_df(self):
-        """Get companies DataFrame with caching and filtering."""
+        """Get companies DataFrame with caching and filtering (memory → disk → provider)."""
         # Simple in-memory cache for companies data (refresh every hour)
-        import time
         current_time = time.time()
         
         if (self._companies_cache is not None and 
             self._cache_timestamp is not None and 
-            current_time - self._cache_timestamp < 3600):  # 1 hour cache
+            current_time - self._cache_timestamp < self._companies_cache_ttl):
             return self._companies_cache
         
+        disk_df = self._load_companies_from_disk(current_time)
+        if disk_df is not None:
+            return disk_df
+        
+        return self._reload_companies_df(current_time)
+    
+    def refresh_companies_df(self):
+        """Reload the companies listing from the provider, bypassing the memory and disk copies.
+        
+        Keeps the old copy on failure.
+        """
+        return self._reload_companies_df(time.time())
+    
+    def _reload_companies_df(self, current_time: float):
+        """Fetch, filter and store the companies listing from the provider."""
         try:
             companies_df = self._fetch_companies_from_provider()
             
             # Filter for active stocks only: type='STOCK' and exchange != 'DELISTED'
             if companies_df is not None and not companies_df.empty:
-                # Apply filters
-                filtered_df = companies_df[
-                    (companies_df['type'] == 'STOCK') & 
-                    (companies_df['exchange'] != 'DELISTED')
-                ].copy()
+                # Apply filters (fused evaluation, no copy - downstream only reads)
+                filtered_df = companies_df.query("type == 'STOCK' and exchange != 'DELISTED'")
                 
                 self._companies_cache = filtered_df
                 self._cache_timestamp = current_time
+                self._listing_reloaded()
+                self._save_companies_to_disk(filtered_df)
                 logger.info(f"Refreshed companies cache: {len(filtered_df)} active stocks (filtered from {len(companies_df)} total)")
                 return filtered_df
             else:
@@ -423,11 +569,15 @@ class StockClient:
             return self._companies_cache  # Return stale cache if available
     
     def search_stock(self, symbol: str) -> Optional[Dict]:
+        if symbol in self._missing_listings:
+            logger.debug("Skipping search for known-missing symbol %s", symbol)
+            return None
+        
         # Check cache first
         if self.cache_manager:
             cached_asset = self.cache_manager.get_asset(symbol)
             if cached_asset and cached_asset.get('asset_type') == 'STOCK':
-                logger.debug(f"Using cached asset info for {symbol}")
+                logger.debug("Using cached asset info for %s", symbol)
                 return {
                     "symbol": cached_asset['symbol'],
                     "company_name": cached_asset['name'],
@@ -440,9 +590,9 @@ class StockClient:
             # Try to get company info from listing (with caching)
             companies_df = self._get_companies_df()
             if companies_df is not None and not companies_df.empty:
-                company_row = companies_df[companies_df['symbol'] == symbol]
-                if not company_row.empty:
-                    info = company_row.iloc[0]
+                position = self._company_position(companies_df, symbol)
+                if position is not None:
+                    info = companies_df.iloc[position]
                     company_name = str(info.get("organ_name", symbol))
                     industry = str(info.get("organ_type", ""))
                     company_type = str(info.get("exchange", ""))  # Use exchange as company_type fallback
@@ -473,7 +623,10 @@ class StockClient:
                     
                     return result
             
-            # Stock not found in listing
+                
+                # Stock not found in a valid listing
+                self._missing_listings.add(symbol)
+            
             return None
         except Exception as e:
             logger.error(f"Error searching stock {symbol}: {e}")
@@ -486,7 +639,7 @@ class StockClient:
             cached_results = self.cache_manager.search_assets_by_name(query, limit)
             stock_results = [r for r in cached_results if r.get('asset_type') == 'STOCK']
             if stock_results:
-                logger.debug(f"Using cached search results for stocks '{query}'")
+                logger.debug("Using cached search results for stocks '%s'", query)
                 return [
                     {
                         "symbol": r['symbol'],
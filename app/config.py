@@ -2,7 +2,13 @@ import os
 
 PORT = int(os.getenv("VN_MARKET_SERVICE_PORT", "8765"))
 HOST = os.getenv("VN_MARKET_SERVICE_HOST", "127.0.0.1")
+# Each worker keeps its own in-memory caches and background refresh tasks
+WORKERS = int(os.getenv("VN_MARKET_SERVICE_WORKERS", "1"))
 CORS_ORIGINS = ["tauri://localhost", "http://localhost:1420"]
+# GET for market data, POST for the /cache and /gold/seed maintenance routes
+CORS_ALLOW_METHODS = ["GET", "POST"]
+CORS_ALLOW_HEADERS = ["Content-Type", "Authorization", "If-None-Match", "X-Test-Mode"]
+CORS_MAX_AGE = 86400  # Browsers may reuse a preflight result for a day
 
 # Local development mode - set to True to disable rate limiting
 LOCAL_DEV_MODE = True  # os.getenv("LOCAL_DEV_MODE", "false").lower() == "true"
@@ -29,6 +35,28 @@ HISTORICAL_CACHE_CONFIG = {
     "auto_fill_today": True,  # Auto-fill today's quote as historical record
     "never_expire": True,  # Historical data never expires (immutable)
     "enable_incremental": True,  # Enable incremental fetching feature
+    "freshness_check_interval": 30,  # Seconds - Skip repeat latest-data checks per symbol within this window
+    "freshness_max_tracked": 10000,  # Maximum symbols remembered by that check (oldest evicted first)
+    "update_threshold_minutes": 30,  # Minutes - Refetch latest record when older than this on weekdays
+}
+
+# Negative Cache Configuration
+# Symbols confirmed missing upstream are remembered briefly so repeated
+# lookups for invalid tickers skip the vnstock round-trip and week fallback
+NEGATIVE_CACHE_CONFIG = {
+    "ttl_seconds": 300,  # 5 minutes - Short enough to pick up new listings quickly
+    "max_size": 10000,  # Maximum remembered symbols (oldest evicted first)
+}
+
+# Stock Listing Cache Configuration
+# The filtered companies listing is persisted next to the database so a
+# restart can reuse it instead of re-downloading it from vnstock
+COMPANIES_CACHE_CONFIG = {
+    "path": os.getenv(
+        "VN_MARKET_COMPANIES_CACHE_PATH",
+        os.path.join(os.path.dirname(os.getenv("VN_MARKET_DB_PATH", "db/assets.db")), "companies_cache.json"),
+    ),
+    "ttl_seconds": 3600,  # 1 hour - Same lifetime as the in-memory listing cache
 }
 
 # Rate Limit Protection Configuration
@@ -61,6 +89,63 @@ IP_RATE_LIMIT_CONFIG = {
 TIMEOUT_CONFIG = {
     "request_timeout_seconds": 30,  # Maximum time for request processing
     "enable_timeout": True,  # Enable request timeout protection
+    "warmup_timeout_seconds": 15,  # Upper bound for each client warm-up call at startup
+    "shutdown_timeout_seconds": 5,  # Upper bound for stopping background tasks on shutdown
+}
+
+# Response Cache Configuration (serialized JSON bodies, per-endpoint TTL in seconds)
+RESPONSE_CACHE_CONFIG = {
+    "max_size": 1024,
+    "quote_ttl": 5,  # Intraday quotes
+    "search_ttl": 60,  # Search results
+    "funds_ttl": 300,  # Fund listing
+    "stats_ttl": 1,  # Cache statistics (monitoring bursts)
+    "history_ttl": 300,  # Price/NAV history ranges
+    "stale_ttl": 3600,  # Keep expired bodies this long as a fallback when upstream fails
+}
+
+# Symbol Lookup Cache Configuration (/search/{symbol} results, cleared on listing refresh)
+SYMBOL_SEARCH_CACHE_CONFIG = {
+    "max_size": 50000,  # Maximum remembered symbols (oldest evicted first)
+    "ttl_seconds": 3600,  # 1 hour - Same lifetime as the stock/fund listings
+    "warm_concurrency": 16,  # Parallel lookups when warming on startup
+    "warm_stocks": ["VNM", "FPT", "MWG", "VCB", "HDB", "ACB", "CTG", "BID", "TCB", "VPB",
+                    "VIC", "VHM", "HPG", "MSN", "GAS", "SAB", "SSI", "STB", "MBB", "PLX"],
+}
+
+# Quote Warm-up Configuration (client quote caches filled in the background after startup)
+QUOTE_WARMUP_CONFIG = {
+    "enabled": True,
+    "symbols": ["VNINDEX", "VN30", "HNX", "HNX30", "UPCOM", "VN.GOLD"],  # Always warmed
+    "fund_count": 20,  # Plus the first N listed funds
+    "warm_concurrency": 4,  # Kept low; every miss is a rate-limited provider call
+}
+
+# HTTP Cache Header Configuration (Cache-Control max-age in seconds by route kind)
+HTTP_CACHE_CONFIG = {
+    "enable_cache_headers": True,
+    "quote_max_age": 5,  # /quote and per-asset quote routes
+    "search_max_age": 60,  # /search
+    "funds_max_age": 300,  # /funds listing
+    "history_max_age": 300,  # /history and per-asset history routes; kept at history_ttl as ranges ending today carry the live row
+    "history_stale_while_revalidate": 60,  # history may be served this long past max-age while refetching
+}
+
+# Response Compression Configuration (gzip when the client sends Accept-Encoding: gzip)
+COMPRESSION_CONFIG = {
+    "enable_gzip": True,
+    "minimum_size": 1024,  # Bytes; small quote bodies are not worth compressing
+    "compresslevel": 6,
+}
+
+# Bulk Quote Configuration (/quotes)
+BULK_QUOTE_CONFIG = {
+    "max_symbols": 50,  # Upper bound on symbols per request, bounding worker fan-out
+}
+
+# Worker Threadpool Configuration (sync route handlers run on this pool)
+THREADPOOL_CONFIG = {
+    "max_workers": int(os.getenv("VN_MARKET_THREADPOOL_SIZE", str(2 * (os.cpu_count() or 4)))),
 }
 
 # Background Tasks Configuration
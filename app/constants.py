@@ -1,63 +1,123 @@
 # Asset classification constants to eliminate hardcoded values across the codebase
 
+import re
+import sys
+from enum import IntEnum
+from types import MappingProxyType
+from typing import NamedTuple, Optional
+
 # Asset Type Classifications
-ASSET_TYPE_FUND = "FUND"
-ASSET_TYPE_STOCK = "STOCK"
-ASSET_TYPE_INDEX = "INDEX"
-ASSET_TYPE_GOLD = "GOLD"
+# (interned so lookups against runtime strings can short-circuit on identity)
+ASSET_TYPE_FUND = sys.intern("FUND")
+ASSET_TYPE_STOCK = sys.intern("STOCK")
+ASSET_TYPE_INDEX = sys.intern("INDEX")
+ASSET_TYPE_GOLD = sys.intern("GOLD")
 
 # Asset Class Mappings
-ASSET_CLASS_FUND = "Investment Fund"
-ASSET_CLASS_STOCK = "Equity"
-ASSET_CLASS_INDEX = "Index"
-ASSET_CLASS_GOLD = "Commodity"
+ASSET_CLASS_FUND = sys.intern("Investment Fund")
+ASSET_CLASS_STOCK = sys.intern("Equity")
+ASSET_CLASS_INDEX = sys.intern("Index")
+ASSET_CLASS_GOLD = sys.intern("Commodity")
 
 # Asset Sub-Class Mappings
-ASSET_SUB_CLASS_FUND = "Mutual Fund"
-ASSET_SUB_CLASS_STOCK = "Stock"
-ASSET_SUB_CLASS_INDEX = "Market Index"
-ASSET_SUB_CLASS_GOLD = "Precious Metal"
+ASSET_SUB_CLASS_FUND = sys.intern("Mutual Fund")
+ASSET_SUB_CLASS_STOCK = sys.intern("Stock")
+ASSET_SUB_CLASS_INDEX = sys.intern("Market Index")
+ASSET_SUB_CLASS_GOLD = sys.intern("Precious Metal")
 
 # Currency Mappings
-CURRENCY_VND = "VND"
-CURRENCY_USD = "USD"
+CURRENCY_VND = sys.intern("VND")
+CURRENCY_USD = sys.intern("USD")
 
 # Data Source
-DATA_SOURCE_VN_MARKET = "VN_MARKET"
-
-# Asset Classification Mapping Dictionary
-ASSET_CLASSIFICATION = {
-    ASSET_TYPE_FUND: {
-        "asset_class": ASSET_CLASS_FUND,
-        "asset_sub_class": ASSET_SUB_CLASS_FUND,
-        "currency": CURRENCY_VND,
-        "data_source": DATA_SOURCE_VN_MARKET
-    },
-    ASSET_TYPE_STOCK: {
-        "asset_class": ASSET_CLASS_STOCK,
-        "asset_sub_class": ASSET_SUB_CLASS_STOCK,
-        "currency": CURRENCY_VND,
-        "data_source": DATA_SOURCE_VN_MARKET
-    },
-    ASSET_TYPE_INDEX: {
-        "asset_class": ASSET_CLASS_INDEX,
-        "asset_sub_class": ASSET_SUB_CLASS_INDEX,
-        "currency": CURRENCY_VND,
-        "data_source": DATA_SOURCE_VN_MARKET
-    },
-    ASSET_TYPE_GOLD: {
-        "asset_class": ASSET_CLASS_GOLD,
-        "asset_sub_class": ASSET_SUB_CLASS_GOLD,
-        "currency": CURRENCY_VND,  # Default to VND
-        "data_source": DATA_SOURCE_VN_MARKET
-    }
-}
-
-# Index Symbol Mappings
-INDEX_SYMBOLS = ["VNINDEX", "VN30", "HNX", "HNX30", "UPCOM"]
+DATA_SOURCE_VN_MARKET = sys.intern("VN_MARKET")
+
+class AssetType(IntEnum):
+    """Ordinal asset type used to index the per-field tuples below."""
+    FUND = 0
+    STOCK = 1
+    INDEX = 2
+    GOLD = 3
+
+
+# Asset type names in ordinal order, and the name -> ordinal lookup for API strings
+ASSET_TYPE_NAMES = (ASSET_TYPE_FUND, ASSET_TYPE_STOCK, ASSET_TYPE_INDEX, ASSET_TYPE_GOLD)
+ASSET_TYPE_FROM_NAME = MappingProxyType({
+    name: AssetType(i) for i, name in enumerate(ASSET_TYPE_NAMES)
+})
+
+# Per-field classification tables indexed by AssetType
+ASSET_CLASS_BY_TYPE = (ASSET_CLASS_FUND, ASSET_CLASS_STOCK, ASSET_CLASS_INDEX, ASSET_CLASS_GOLD)
+ASSET_SUB_CLASS_BY_TYPE = (ASSET_SUB_CLASS_FUND, ASSET_SUB_CLASS_STOCK, ASSET_SUB_CLASS_INDEX, ASSET_SUB_CLASS_GOLD)
+CURRENCY_BY_TYPE = (CURRENCY_VND, CURRENCY_VND, CURRENCY_VND, CURRENCY_VND)  # Gold defaults to VND
+DATA_SOURCE_BY_TYPE = (DATA_SOURCE_VN_MARKET,) * len(AssetType)
+
+
+class AssetClassification(NamedTuple):
+    """Fixed classification record for one asset type."""
+    asset_class: str
+    asset_sub_class: str
+    currency: str
+    data_source: str
+
+
+# Asset Classification Mapping Dictionary (read-only; built from the per-field tables)
+ASSET_CLASSIFICATION = MappingProxyType({
+    name: AssetClassification(
+        asset_class=ASSET_CLASS_BY_TYPE[type_id],
+        asset_sub_class=ASSET_SUB_CLASS_BY_TYPE[type_id],
+        currency=CURRENCY_BY_TYPE[type_id],
+        data_source=DATA_SOURCE_BY_TYPE[type_id]
+    )
+    for name, type_id in ASSET_TYPE_FROM_NAME.items()
+})
+
+# Index Symbol Mappings (ordered for listings, frozenset for membership tests)
+INDEX_SYMBOLS_ORDER = tuple(sys.intern(s) for s in ("VNINDEX", "VN30", "HNX", "HNX30", "UPCOM"))
+INDEX_SYMBOLS = frozenset(INDEX_SYMBOLS_ORDER)
 
 # Gold Provider Symbols (for detection)
-GOLD_PROVIDERS = {
-    "VN.GOLD": "SJC",
-    "VN.GOLD.C": "SJC"
-}
+GOLD_PROVIDERS = MappingProxyType({
+    sys.intern("VN.GOLD"): "SJC",
+    sys.intern("VN.GOLD.C"): "SJC"
+})
+
+# Free-text gold detection. The separator variants ("vn gold", "vn_gold",
+# "vngold") all contain "gold", so one alternation covers every pattern.
+GOLD_QUERY_RE = re.compile(r"gold|sjc|btmc|msn", re.IGNORECASE)
+
+# Flat symbol -> asset type table for symbols known at import time
+SYMBOL_TO_TYPE = MappingProxyType({
+    **{symbol: ASSET_TYPE_INDEX for symbol in INDEX_SYMBOLS_ORDER},
+    **{symbol: ASSET_TYPE_GOLD for symbol in GOLD_PROVIDERS},
+})
+
+
+def classify_symbol(symbol: str, default: Optional[str] = ASSET_TYPE_STOCK) -> Optional[str]:
+    """Return the asset type for a known index/gold symbol, or default."""
+    return SYMBOL_TO_TYPE.get(symbol, default)
+
+
+def get_classification(asset_type: str) -> Optional[AssetClassification]:
+    """Return the shared classification record for an asset type, or None."""
+    return ASSET_CLASSIFICATION.get(asset_type)
+
+
+__all__ = (
+    "ASSET_TYPE_FUND", "ASSET_TYPE_STOCK", "ASSET_TYPE_INDEX", "ASSET_TYPE_GOLD",
+    "ASSET_CLASS_FUND", "ASSET_CLASS_STOCK", "ASSET_CLASS_INDEX", "ASSET_CLASS_GOLD",
+    "ASSET_SUB_CLASS_FUND", "ASSET_SUB_CLASS_STOCK", "ASSET_SUB_CLASS_INDEX", "ASSET_SUB_CLASS_GOLD",
+    "CURRENCY_VND", "CURRENCY_USD",
+    "DATA_SOURCE_VN_MARKET",
+    "AssetType", "ASSET_TYPE_NAMES", "ASSET_TYPE_FROM_NAME",
+    "ASSET_CLASS_BY_TYPE", "ASSET_SUB_CLASS_BY_TYPE", "CURRENCY_BY_TYPE", "DATA_SOURCE_BY_TYPE",
+    "AssetClassification",
+    "ASSET_CLASSIFICATION",
+    "INDEX_SYMBOLS",
+    "INDEX_SYMBOLS_ORDER",
+    "GOLD_PROVIDERS",
+    "GOLD_QUERY_RE",
+    "SYMBOL_TO_TYPE",
+    "classify_symbol",
+    "get_classification",
+)
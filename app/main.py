@@ -10,21 +10,27 @@ if sys.version_info < (3, 9):
 # Configure vnstock timeout before importing clients
 from app import vnstock_config
 
-from fastapi import FastAPI, HTTPException, Query, Request
-from fastapi.responses import JSONResponse
+from fastapi import Depends, FastAPI, HTTPException, Path, Query, Request
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from app.models import (
+FundBasicInfo,
 FundListResponse,
 FundSearchResponse,
 FundQuoteResponse,
+FundHistoryItem,
 FundHistoryResponse,
 StockSearchResponse,
 StockQuoteResponse,
+StockHistoryItem,
 StockHistoryResponse,
 IndexQuoteResponse,
+IndexHistoryItem,
 IndexHistoryResponse,
 GoldSearchResponse,
 GoldQuoteResponse,
+GoldHistoryItem,
 GoldHistoryResponse,
 HealthResponse,
 SearchResponse,
@@ -34,15 +40,16 @@ from app.clients.fund_client import FundClient
 from app.clients.stock_client import StockClient
 from app.clients.index_client import IndexClient
 from app.clients.gold_client import GoldClient
-from app.config import HOST, PORT, CORS_ORIGINS, IP_RATE_LIMIT_CONFIG, RATE_LIMIT_CONFIG, TIMEOUT_CONFIG
+from app.config import HOST, PORT, WORKERS, CORS_ORIGINS, CORS_ALLOW_METHODS, CORS_ALLOW_HEADERS, CORS_MAX_AGE, IP_RATE_LIMIT_CONFIG, RATE_LIMIT_CONFIG, TIMEOUT_CONFIG, THREADPOOL_CONFIG, RESPONSE_CACHE_CONFIG, HTTP_CACHE_CONFIG, COMPRESSION_CONFIG, BULK_QUOTE_CONFIG, QUOTE_WARMUP_CONFIG, SYMBOL_SEARCH_CACHE_CONFIG, LOCAL_DEV_MODE
 from app.cache.cache_manager import CacheManager
-from app.cache.memory_cache import quote_cache, search_cache, cleanup_expired_caches, get_cache_stats
+from app.cache.memory_cache import quote_cache, search_cache, single_flight, async_single_flight, cleanup_expired_caches, get_cache_stats
 from app.cache.search_optimizer import get_search_optimizer
-from app.cache.background_manager import start_cache_background_tasks, stop_cache_background_tasks
+from app.cache.response_cache import response_cache, symbol_search_cache, serialize_response
+from app.cache.background_manager import start_cache_background_tasks, stop_cache_background_tasks, request_cache_refresh
 from app.cache.data_seeder import get_data_seeder
-from app.cache.gold_static_seeder import get_gold_seeder
 from app.cache.ip_rate_limiter import IPRateLimiter
-from app.utils.date_utils import validate_and_set_dates
+from app.utils.date_utils import validate_and_set_dates, today_str
+from app.utils.market_time_utils import is_after_market_close
 from app.utils.response_validator import ResponseValidator
 from app.utils.asset_type_detector import AssetTypeDetector
 from app.utils.error_handler import validate_client_available
@@ -50,13 +57,22 @@ from app.constants import (
     ASSET_TYPE_FUND, ASSET_TYPE_STOCK, ASSET_TYPE_INDEX, ASSET_TYPE_GOLD,
     ASSET_CLASS_FUND, ASSET_CLASS_STOCK, ASSET_CLASS_INDEX, ASSET_CLASS_GOLD,
     ASSET_SUB_CLASS_FUND, ASSET_SUB_CLASS_STOCK, ASSET_SUB_CLASS_INDEX, ASSET_SUB_CLASS_GOLD,
-    INDEX_SYMBOLS, DATA_SOURCE_VN_MARKET, CURRENCY_VND
+    INDEX_SYMBOLS_ORDER, DATA_SOURCE_VN_MARKET, CURRENCY_VND, GOLD_QUERY_RE, GOLD_PROVIDERS,
+    get_classification
 )
 import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Tuple
 from datetime import datetime, timedelta
 import asyncio
+import hashlib
 import ipaddress
+import re
+import anyio.to_thread
 from asyncio import wait_for, TimeoutError
+from concurrent.futures import ThreadPoolExecutor
 
 logging.basicConfig(
     level=logging.INFO,
@@ -88,17 +104,90 @@ def get_client_ip(request: Request) -> str:
 app = FastAPI(
     title="Vietnamese Market Data Service",
     description="Market data provider for Vietnamese assets (stocks, funds, indices) using vnstock",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse
 )
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=CORS_ALLOW_METHODS,
+    allow_headers=CORS_ALLOW_HEADERS,
+    max_age=CORS_MAX_AGE,
 )
 
+def _etag(body: bytes) -> str:
+    """Weak ETag for a response body.
+
+    Weak because GZipMiddleware may send the same body gzip- or identity-encoded,
+    and a strong validator must differ between content codings.
+    """
+    return f'W/"{hashlib.blake2s(body, digest_size=8).hexdigest()}"'
+
+def _if_none_match(request: Request, etag: str) -> bool:
+    """Weak comparison of If-None-Match (a tag list or *) against etag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+def _conditional_response(request: Request, body: bytes, max_age: int, stale_while_revalidate: int = 0) -> Response:
+    """Serve a JSON body with Cache-Control/ETag, or an empty 304 if the client already has it."""
+    if not HTTP_CACHE_CONFIG["enable_cache_headers"]:
+        return Response(content=body, media_type="application/json")
+
+    etag = _etag(body)
+    cache_control = f"public, max-age={max_age}"
+    if stale_while_revalidate:
+        cache_control += f", stale-while-revalidate={stale_while_revalidate}"
+    headers = {"Cache-Control": cache_control, "ETag": etag}
+    if _if_none_match(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def _http_cache_max_age(path: str) -> Optional[int]:
+    """Return the Cache-Control max-age for a cacheable GET path, or None."""
+    segments = path.strip("/").split("/")
+    head = segments[:2]
+    if "history" in head:
+        return HTTP_CACHE_CONFIG["history_max_age"]
+    if "quote" in head:
+        return HTTP_CACHE_CONFIG["quote_max_age"]
+    if segments[0] == "search":
+        return HTTP_CACHE_CONFIG["search_max_age"]
+    if segments == ["funds"]:
+        return HTTP_CACHE_CONFIG["funds_max_age"]
+    return None
+
+@app.middleware("http")
+async def http_cache_headers_middleware(request: Request, call_next):
+    """Add Cache-Control to market data responses and answer If-None-Match with 304.
+
+    Bodies are never read here: routes serving cached bodies tag them with an
+    ETag on the worker thread (_tagged_response), and everything else streams
+    through with Cache-Control only.
+    """
+    if not HTTP_CACHE_CONFIG["enable_cache_headers"] or request.method != "GET":
+        return await call_next(request)
+
+    max_age = _http_cache_max_age(request.url.path)
+    response = await call_next(request)
+    # Routes that set their own validators (see _conditional_response) pass through as is
+    if max_age is None or response.status_code != 200 or "cache-control" in response.headers:
+        return response
+
+    response.headers["Cache-Control"] = f"public, max-age={max_age}"
+    etag = response.headers.get("etag")
+    if etag is not None and _if_none_match(request, etag):
+        # The unread body is discarded once this response is sent
+        headers = {"Cache-Control": response.headers["Cache-Control"], "ETag": etag}
+        return Response(status_code=304, headers=headers)
+    return response
+
 @app.middleware("http")
 async def timeout_middleware(request: Request, call_next):
     """Apply request timeout to all endpoints."""
@@ -111,8 +200,8 @@ async def timeout_middleware(request: Request, call_next):
         # Use asyncio.wait_for to enforce timeout
         return await wait_for(call_next(request), timeout=timeout_seconds)
     except TimeoutError:
-        logger.warning(f"Request timeout after {timeout_seconds}s: {request.method} {request.url}")
-        return JSONResponse(
+        logger.warning("Request timeout after %ss: %s %s", timeout_seconds, request.method, request.url)
+        return ORJSONResponse(
             status_code=408,  # Request Timeout
             content={
                 "error": "Request Timeout",
@@ -125,12 +214,11 @@ async def timeout_middleware(request: Request, call_next):
 async def ip_rate_limit_middleware(request: Request, call_next):
     """Apply per-IP rate limiting to all requests, excluding health check endpoints and test requests."""
     # Skip rate limiting entirely in local dev mode
-    from app.config import LOCAL_DEV_MODE
     if LOCAL_DEV_MODE:
         return await call_next(request)
     
     # Skip rate limiting for health check and monitoring endpoints
-    if request.url.path in ["/health", "/cache/stats", "/cache/lazy-fetch/status", "/cache/seed/progress", "/cache/ip-rate-limits"]:
+    if request.url.path in ["/health", "/health/live", "/health/ready", "/cache/stats", "/cache/lazy-fetch/status", "/cache/seed/progress", "/cache/ip-rate-limits"]:
         return await call_next(request)
 
     # Skip rate limiting for test requests (identified by custom header)
@@ -146,7 +234,7 @@ async def ip_rate_limit_middleware(request: Request, call_next):
         response = await call_next(request)
         return response
     else:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=429,
             content={
                 "error": "Rate limit exceeded for your IP address",
@@ -155,6 +243,15 @@ async def ip_rate_limit_middleware(request: Request, call_next):
             }
         )
 
+# Added last so it is the outermost middleware: ETags and 304s above are computed
+# on the uncompressed body, and only bodies actually sent get compressed
+if COMPRESSION_CONFIG["enable_gzip"]:
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=COMPRESSION_CONFIG["minimum_size"],
+        compresslevel=COMPRESSION_CONFIG["compresslevel"]
+    )
+
 # Initialize cache manager and clients
 cache_manager = CacheManager()
 
@@ -170,7 +267,7 @@ try:
     logger.info("Initializing FundClient...")
     fund_client = FundClient(cache_manager, quote_cache)
 except Exception as e:
-    logger.error(f"Failed to initialize FundClient: {e}")
+    logger.error("Failed to initialize FundClient: %s", e)
     logger.warning("Proceeding with degraded fund service - fund requests may fail")
     fund_client = None
 
@@ -178,7 +275,7 @@ try:
     logger.info("Initializing StockClient...")
     stock_client = StockClient(cache_manager, quote_cache)
 except Exception as e:
-    logger.error(f"Failed to initialize StockClient: {e}")
+    logger.error("Failed to initialize StockClient: %s", e)
     logger.warning("Proceeding with degraded stock service - stock requests may fail")
     stock_client = None
 
@@ -186,7 +283,7 @@ try:
     logger.info("Initializing IndexClient...")
     index_client = IndexClient(cache_manager, quote_cache)
 except Exception as e:
-    logger.error(f"Failed to initialize IndexClient: {e}")
+    logger.error("Failed to initialize IndexClient: %s", e)
     logger.warning("Proceeding with degraded index service - index requests may fail")
     index_client = None
 
@@ -194,30 +291,206 @@ try:
     logger.info("Initializing GoldClient...")
     gold_client = GoldClient(cache_manager, quote_cache)
 except Exception as e:
-    logger.error(f"Failed to initialize GoldClient: {e}")
+    logger.error("Failed to initialize GoldClient: %s", e)
     logger.warning("Proceeding with degraded gold service - gold requests may fail")
     gold_client = None
 
+# Thread pool for the blocking client calls fanned out by /search
+_search_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="search")
+
+# Constant search-result fields per asset type (read-only, shared); each hit adds
+# only its own symbol/name/exchange
+_STOCK_DESCRIPTOR = MappingProxyType(ResponseValidator.enrich_search_result({"exchange": ""}, ASSET_TYPE_STOCK))
+_FUND_DESCRIPTOR = MappingProxyType(ResponseValidator.enrich_search_result({"exchange": "VN"}, ASSET_TYPE_FUND))
+_INDEX_DESCRIPTOR = MappingProxyType(ResponseValidator.enrich_search_result({"exchange": ""}, ASSET_TYPE_INDEX))
+_GOLD_DESCRIPTOR = MappingProxyType(ResponseValidator.enrich_search_result({"exchange": ""}, ASSET_TYPE_GOLD))
+
+# Search records for the fixed index universe, enriched once at import
+_INDEX_RECORDS = {
+    idx: ResponseValidator.enrich_search_result({
+        "symbol": idx,
+        "name": f"Vietnam {idx} Index"
+    }, ASSET_TYPE_INDEX)
+    for idx in INDEX_SYMBOLS_ORDER
+}
+
+@lru_cache(maxsize=1)
+def _gold_provider_records() -> Tuple[dict, ...]:
+    """Search records for the static gold provider list, built on first gold query."""
+    return tuple(
+        {
+            **_GOLD_DESCRIPTOR,
+            "symbol": provider["symbol"],
+            "name": provider["name"],
+            "asset_type": provider["asset_type"],
+            "exchange": provider["exchange"],
+            "currency": provider["currency"]
+        }
+        for provider in gold_client.get_all_gold_providers()
+    )
+
+@dataclass(frozen=True, slots=True)
+class NormalizedQuery:
+    """Search query with its case-normalized forms, computed once per request."""
+    raw: str
+    upper: str
+    lower: str
+
+
+def normalized_query(
+    query: str = Query(..., description="Search query by symbol or name for stocks, funds, indices, or gold")
+) -> NormalizedQuery:
+    """FastAPI dependency that normalizes the search query for all sub-searches."""
+    return NormalizedQuery(query, query.upper(), query.lower())
+
+# Characters that appear in listed stock, fund, index and gold symbols
+_SYMBOL_PATTERN = r"^[A-Za-z0-9._-]{1,32}$"
+
+_SYMBOL_RE = re.compile(_SYMBOL_PATTERN)
+
+def normalized_symbol(
+    symbol: str = Path(..., pattern=_SYMBOL_PATTERN, description="Asset symbol (stock, fund, index or gold)")
+) -> str:
+    """FastAPI dependency that rejects malformed symbols with 422 and upper-cases the rest."""
+    return symbol.upper()
+
+def history_date_range(
+    start_date: Optional[str] = Query(None, description="Start date in YYYY-MM-DD format (default: 1 year ago)"),
+    end_date: Optional[str] = Query(None, description="End date in YYYY-MM-DD format (default: today)")
+) -> Tuple[str, str]:
+    """FastAPI dependency that validates a history range (400 on bad input) and fills in defaults."""
+    return validate_and_set_dates(start_date, end_date, allow_future_dates=False)
+
+def _detect_asset_type(symbol: str) -> str:
+    """Classify a symbol using the seeded asset index first, then the detector heuristics."""
+    return AssetTypeDetector.detect_asset_type(symbol, {
+        'fund_client': fund_client,
+        'gold_client': gold_client,
+        'asset_type_index': data_seeder.asset_type_index if data_seeder else None
+    })
+
+# Row keys each history response_model documents; cached and provider rows carry extras
+_HISTORY_ROW_FIELDS = {
+    ASSET_TYPE_STOCK: tuple(StockHistoryItem.model_fields),
+    ASSET_TYPE_INDEX: tuple(IndexHistoryItem.model_fields),
+    ASSET_TYPE_FUND: tuple(FundHistoryItem.model_fields),
+    ASSET_TYPE_GOLD: tuple(GoldHistoryItem.model_fields),
+}
+
+def _history_row(record: dict, fields: Tuple[str, ...]) -> dict:
+    """Trim a client record to the item model's fields without validating it."""
+    return {key: record[key] for key in fields if key in record}
+
+def _history_payload(symbol: str, history: list, asset_type: str) -> dict:
+    """Build a history response body from trusted client records without re-validating each row."""
+    fields = _HISTORY_ROW_FIELDS[asset_type]
+    return {
+        "symbol": symbol,
+        "history": [_history_row(record, fields) for record in history],
+        **get_classification(asset_type)._asdict()
+    }
+
+def _fetch_history(fetch, symbol: str, start_date: str, end_date: str, not_found_label: str = "") -> list:
+    """Call a client history method with validated dates, raising 404 when it returns nothing."""
+    history = fetch(symbol, start_date, end_date)
+    if not history:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No history found for {not_found_label}{symbol}"
+        )
+    return history
+
+def _history(fetch, asset_type: str, symbol: str, start_date: str, end_date: str, not_found_label: str = "") -> dict:
+    """Shared body of the per-asset history endpoints (dates already validated)."""
+    try:
+        history = _fetch_history(fetch, symbol, start_date, end_date, not_found_label)
+        return _history_payload(symbol, history, asset_type)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error in %s history for %s: %s", asset_type.lower(), symbol, e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+def _cached_body(key: str, ttl: float, build) -> bytes:
+    """Return a recently built JSON body for key, or build, serialize and cache it."""
+    body = response_cache.get(key)
+    if body is None:
+        # Concurrent misses for the same key wait on one upstream fetch
+        body = single_flight.do(key, lambda: _build_response_body(key, ttl, build))
+    return body
+
+def _tagged_response(body: bytes) -> Response:
+    """JSON response for a pre-serialized body, with the ETag the header middleware matches on."""
+    return Response(content=body, media_type="application/json", headers={"ETag": _etag(body)})
+
+def _cached_response(key: str, ttl: float, build) -> Response:
+    """Serve a recently built JSON body for key, or build, serialize and cache it."""
+    return _tagged_response(_cached_body(key, ttl, build))
+
+def _history_response(request: Request, key: str, build) -> Response:
+    """Serve a cached history body with its validators set here, so the header
+    middleware never has to buffer and hash the (large) body on the event loop."""
+    body = _cached_body(key, RESPONSE_CACHE_CONFIG["history_ttl"], build)
+    return _conditional_response(
+        request, body, HTTP_CACHE_CONFIG["history_max_age"],
+        HTTP_CACHE_CONFIG["history_stale_while_revalidate"]
+    )
+
+def _build_response_body(key: str, ttl: float, build) -> bytes:
+    try:
+        content = build()
+    except Exception as e:
+        # Client errors (bad dates, unknown symbols) are real answers; upstream
+        # failures fall back to the last good body if one is still held
+        if isinstance(e, HTTPException) and e.status_code < 500:
+            raise
+        stale = response_cache.get_stale(key)
+        if stale is None:
+            raise
+        logger.warning("Serving stale %s after upstream error: %s", key, e)
+        return stale
+    body = serialize_response(content)
+    response_cache.set(key, body, ttl)
+    return body
+
 # Initialize search and data seeder (may fail if clients failed)
 try:
     search_optimizer = get_search_optimizer(cache_manager, search_cache)
     data_seeder = get_data_seeder(cache_manager, stock_client, fund_client, gold_client)
 except Exception as e:
-    logger.error(f"Failed to initialize search optimizer or data seeder: {e}")
+    logger.error("Failed to initialize search optimizer or data seeder: %s", e)
     search_optimizer = None
     data_seeder = None
 
+# Health probe body never changes, so it is serialized once at import
+_HEALTH_JSON = serialize_response(HealthResponse(
+    status="healthy",
+    service="vn-market-service",
+    version="2.0.0"
+))
+
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
-    return HealthResponse(
-        status="healthy",
-        service="vn-market-service",
-        version="2.0.0"
-    )
+    return Response(content=_HEALTH_JSON, media_type="application/json")
+
+@app.get("/health/live")
+async def health_live():
+    """Liveness probe: the process is up and serving, whether or not caches are warm."""
+    return {"status": "alive"}
+
+@app.get("/health/ready")
+async def health_ready():
+    """Readiness probe: 503 until startup seeding and listing warm-up have finished."""
+    if _startup_task is None or not _startup_task.done():
+        return ORJSONResponse({"status": "starting"}, status_code=503)
+    return {"status": "ready"}
 
 @app.get("/cache/stats")
-async def get_cache_statistics():
+def get_cache_statistics():
     """Get cache statistics for monitoring."""
+    return _cached_response("cache_stats", RESPONSE_CACHE_CONFIG["stats_ttl"], _get_cache_statistics)
+
+def _get_cache_statistics() -> dict:
     try:
         memory_stats = get_cache_stats()
         persistent_stats = cache_manager.get_stats()
@@ -228,7 +501,7 @@ async def get_cache_statistics():
             "cache_enabled": True
         }
     except Exception as e:
-        logger.error(f"Error getting cache stats: {e}")
+        logger.error("Error getting cache stats: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/cache/lazy-fetch/status")
@@ -246,11 +519,11 @@ async def get_lazy_fetch_status(symbol: str = None):
             "timestamp": datetime.now().isoformat()
         }
     except Exception as e:
-        logger.error(f"Error getting lazy fetch status: {e}")
+        logger.error("Error getting lazy fetch status: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/cache/cleanup")
-async def cleanup_cache():
+def cleanup_cache():
     """Manually trigger cache cleanup."""
     try:
         # Clean memory caches
@@ -261,14 +534,25 @@ async def cleanup_cache():
         
         return {"message": "Cache cleanup completed successfully"}
     except Exception as e:
-        logger.error(f"Error during cache cleanup: {e}")
+        logger.error("Error during cache cleanup: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/cache/refresh")
+async def refresh_cache():
+    """Trigger an immediate background refresh of the stock, fund and gold listings."""
+    if not request_cache_refresh():
+        raise HTTPException(status_code=503, detail="Background cache tasks are not running")
+    
+    return {
+        "message": "Cache refresh requested",
+        "timestamp": datetime.now().isoformat()
+    }
+
 @app.post("/cache/seed")
 async def seed_cache(force_refresh: bool = False):
     """Manually trigger cache seeding with all available assets."""
     try:
-        logger.info(f"Manual cache seeding triggered (force_refresh={force_refresh})")
+        logger.info("Manual cache seeding triggered (force_refresh=%s)", force_refresh)
         counts = await data_seeder.seed_all_assets(force_refresh=force_refresh)
         
         # Note: Not refreshing popular asset quotes to avoid delays
@@ -280,7 +564,7 @@ async def seed_cache(force_refresh: bool = False):
             "timestamp": datetime.now().isoformat()
         }
     except Exception as e:
-        logger.error(f"Error during cache seeding: {e}")
+        logger.error("Error during cache seeding: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/cache/seed/progress")
@@ -290,13 +574,14 @@ async def get_seeding_progress():
         progress = data_seeder.get_seeding_progress()
         return progress
     except Exception as e:
-        logger.error(f"Error getting seeding progress: {e}")
+        logger.error("Error getting seeding progress: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/gold/seed")
-async def seed_gold_historical():
+def seed_gold_historical():
     """Manually trigger gold historical data seeding."""
     try:
+        # Only this maintenance route uses the seeder, so its module is not loaded at startup
         from app.cache.gold_static_seeder import get_gold_seeder
         gold_seeder = get_gold_seeder()
         
@@ -309,7 +594,7 @@ async def seed_gold_historical():
             "data": stats
         }
     except Exception as e:
-        logger.error(f"Error during gold seeding: {e}")
+        logger.error("Error during gold seeding: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/cache/ip-rate-limits")
@@ -322,7 +607,7 @@ async def get_ip_rate_limit_stats():
             "timestamp": datetime.now().isoformat()
         }
     except Exception as e:
-        logger.error(f"Error getting IP rate limit stats: {e}")
+        logger.error("Error getting IP rate limit stats: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/cache/ip-rate-limits/{client_ip}")
@@ -342,7 +627,7 @@ async def get_ip_specific_stats(client_ip: str):
             "timestamp": datetime.now().isoformat()
         }
     except Exception as e:
-        logger.error(f"Error getting IP-specific stats for {client_ip}: {e}")
+        logger.error("Error getting IP-specific stats for %s: %s", client_ip, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/config/timeout")
@@ -354,52 +639,46 @@ async def get_timeout_config():
     }
 
 @app.get("/funds", response_model=FundListResponse)
-async def get_funds_list():
+def get_funds_list():
+    return _cached_response("funds", RESPONSE_CACHE_CONFIG["funds_ttl"], _get_funds_list)
+
+def _get_funds_list() -> FundListResponse:
     try:
         validate_client_available(fund_client, "Fund")
-        funds = fund_client.get_funds_list()
-        validated_funds = []
-
-        for f in funds:
-            fund_dict = ResponseValidator.enrich_response_with_classification({
-                "symbol": f["symbol"],
-                "fund_name": f["fund_name"],
-                "asset_type": f["asset_type"]
-            }, ASSET_TYPE_FUND)
-
-            # Validate the response
-            if not ResponseValidator.validate_response_fields(fund_dict, ASSET_TYPE_FUND):
-                logger.warning(f"Validation failed for fund list item {f['symbol']}")
-            validated_funds.append(fund_dict)
-
-        return FundListResponse(
-            funds=validated_funds,
+        validated_funds = fund_client.get_validated_funds_list()
+
+        # Entries were shaped and validated when the listing was cached, so
+        # skip per-fund model validation on every rebuild
+        return FundListResponse.model_construct(
+            funds=[FundBasicInfo.model_construct(**fund) for fund in validated_funds],
             total=len(validated_funds)
         )
     except Exception as e:
-        logger.error(f"Error in get_funds_list: {e}")
+        logger.error("Error in get_funds_list: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/funds/search/{symbol}", response_model=FundSearchResponse)
-async def search_fund(symbol: str):
+def search_fund(symbol: str = Depends(normalized_symbol)):
     try:
         if not fund_client:
             raise HTTPException(status_code=503, detail="Fund service is temporarily unavailable. API timeout or connection issue detected.")
-        symbol = symbol.upper()
         fund_info = fund_client.search_fund_by_symbol(symbol)
         
         if not fund_info:
             raise HTTPException(status_code=404, detail=f"Fund {symbol} not found")
         
-        return FundSearchResponse(**fund_info)
+        return Response(content=serialize_response(FundSearchResponse(**fund_info)), media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in search_fund: {e}")
+        logger.error("Error in search_fund: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/funds/quote/{symbol}", response_model=FundQuoteResponse)
-async def get_fund_quote(symbol: str):
+def get_fund_quote(symbol: str = Depends(normalized_symbol)):
+    return _cached_response(f"fund_quote:{symbol}", RESPONSE_CACHE_CONFIG["quote_ttl"], lambda: _get_fund_quote(symbol))
+
+def _get_fund_quote(symbol: str) -> FundQuoteResponse:
     try:
         if not fund_client:
             raise HTTPException(status_code=503, detail="Fund service is temporarily unavailable. API timeout or connection issue detected.")
@@ -413,57 +692,38 @@ async def get_fund_quote(symbol: str):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in get_fund_quote: {e}")
+        logger.error("Error in get_fund_quote: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/funds/history/{symbol}", response_model=FundHistoryResponse)
-async def get_fund_history(
-    symbol: str,
-    start_date: str = Query(None, description="Start date in YYYY-MM-DD format"),
-    end_date: str = Query(None, description="End date in YYYY-MM-DD format")
-):
-    try:
-        validate_client_available(fund_client, "Fund")
-        symbol = symbol.upper()
-
-        start_date, end_date = validate_and_set_dates(start_date, end_date, allow_future_dates=False)
-
-        history = fund_client.get_fund_nav_history(symbol, start_date, end_date)
-
-        if not history:
-            raise HTTPException(
-                status_code=404,
-                detail=f"No history found for {symbol}"
-            )
-
-        return FundHistoryResponse(
-            symbol=symbol,
-            history=history
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error in get_fund_history: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+def get_fund_history(request: Request, symbol: str = Depends(normalized_symbol), dates: Tuple[str, str] = Depends(history_date_range)):
+    start_date, end_date = dates
+    validate_client_available(fund_client, "Fund")
+    return _history_response(
+        request, f"fund_history:{symbol}:{start_date}:{end_date}",
+        lambda: _history(fund_client.get_fund_nav_history, ASSET_TYPE_FUND, symbol, start_date, end_date)
+    )
 
 @app.get("/stocks/search/{symbol}", response_model=StockSearchResponse)
-async def search_stock(symbol: str):
+def search_stock(symbol: str = Depends(normalized_symbol)):
     try:
-        symbol = symbol.upper()
         stock_info = stock_client.search_stock(symbol)
         
         if not stock_info:
             raise HTTPException(status_code=404, detail=f"Stock {symbol} not found")
         
-        return StockSearchResponse(**stock_info)
+        return Response(content=serialize_response(StockSearchResponse(**stock_info)), media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in search_stock: {e}")
+        logger.error("Error in search_stock: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/stocks/quote/{symbol}", response_model=StockQuoteResponse)
-async def get_stock_quote(symbol: str):
+def get_stock_quote(symbol: str = Depends(normalized_symbol)):
+    return _cached_response(f"stock_quote:{symbol}", RESPONSE_CACHE_CONFIG["quote_ttl"], lambda: _get_stock_quote(symbol))
+
+def _get_stock_quote(symbol: str) -> StockQuoteResponse:
     try:
         symbol = symbol.upper()
         quote = stock_client.get_latest_quote(symbol)
@@ -475,40 +735,23 @@ async def get_stock_quote(symbol: str):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in get_stock_quote: {e}")
+        logger.error("Error in get_stock_quote: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/stocks/history/{symbol}", response_model=StockHistoryResponse)
-async def get_stock_history(
-    symbol: str,
-    start_date: str = Query(None, description="Start date in YYYY-MM-DD format"),
-    end_date: str = Query(None, description="End date in YYYY-MM-DD format")
-):
-    try:
-        symbol = symbol.upper()
-
-        start_date, end_date = validate_and_set_dates(start_date, end_date, allow_future_dates=False)
-
-        history = stock_client.get_stock_history(symbol, start_date, end_date)
-
-        if not history:
-            raise HTTPException(
-                status_code=404,
-                detail=f"No history found for {symbol}"
-            )
-
-        return StockHistoryResponse(
-            symbol=symbol,
-            history=history
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error in get_stock_history: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+def get_stock_history(request: Request, symbol: str = Depends(normalized_symbol), dates: Tuple[str, str] = Depends(history_date_range)):
+    start_date, end_date = dates
+    validate_client_available(stock_client, "Stock")
+    return _history_response(
+        request, f"stock_history:{symbol}:{start_date}:{end_date}",
+        lambda: _history(stock_client.get_stock_history, ASSET_TYPE_STOCK, symbol, start_date, end_date)
+    )
 
 @app.get("/indices/quote/{symbol}", response_model=IndexQuoteResponse)
-async def get_index_quote(symbol: str):
+def get_index_quote(symbol: str = Depends(normalized_symbol)):
+    return _cached_response(f"index_quote:{symbol}", RESPONSE_CACHE_CONFIG["quote_ttl"], lambda: _get_index_quote(symbol))
+
+def _get_index_quote(symbol: str) -> IndexQuoteResponse:
     try:
         symbol = symbol.upper()
         quote = index_client.get_latest_quote(symbol)
@@ -520,40 +763,20 @@ async def get_index_quote(symbol: str):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in get_index_quote: {e}")
+        logger.error("Error in get_index_quote: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/indices/history/{symbol}", response_model=IndexHistoryResponse)
-async def get_index_history(
-    symbol: str,
-    start_date: str = Query(None, description="Start date in YYYY-MM-DD format"),
-    end_date: str = Query(None, description="End date in YYYY-MM-DD format")
-):
-    try:
-        symbol = symbol.upper()
-
-        start_date, end_date = validate_and_set_dates(start_date, end_date, allow_future_dates=False)
-
-        history = index_client.get_index_history(symbol, start_date, end_date)
-
-        if not history:
-            raise HTTPException(
-                status_code=404,
-                detail=f"No history found for index {symbol}"
-            )
-
-        return IndexHistoryResponse(
-            symbol=symbol,
-            history=history
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error in get_index_history: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+def get_index_history(request: Request, symbol: str = Depends(normalized_symbol), dates: Tuple[str, str] = Depends(history_date_range)):
+    start_date, end_date = dates
+    validate_client_available(index_client, "Index")
+    return _history_response(
+        request, f"index_history:{symbol}:{start_date}:{end_date}",
+        lambda: _history(index_client.get_index_history, ASSET_TYPE_INDEX, symbol, start_date, end_date, "index ")
+    )
 
 @app.get("/gold/search/{symbol}", response_model=GoldSearchResponse, tags=["Gold"])
-async def search_gold(symbol: str):
+def search_gold(symbol: str = Depends(normalized_symbol)):
     """
     Search for gold asset information by provider symbol.
     
@@ -578,15 +801,15 @@ async def search_gold(symbol: str):
         gold_info = gold_client.search_gold(symbol)
         if not gold_info:
             raise HTTPException(status_code=404, detail=f"Gold provider {symbol} not found")
-        return GoldSearchResponse(**gold_info)
+        return Response(content=serialize_response(GoldSearchResponse(**gold_info)), media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in search_gold: {e}")
+        logger.error("Error in search_gold: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/gold/quote/{symbol}", response_model=GoldQuoteResponse, tags=["Gold"])
-async def get_gold_quote(symbol: str):
+def get_gold_quote(symbol: str = Depends(normalized_symbol)):
     """
     Get the latest gold price quote from a specific provider.
     
@@ -609,6 +832,9 @@ async def get_gold_quote(symbol: str):
         404: Provider symbol not found or quote unavailable
         500: API error
     """
+    return _cached_response(f"gold_quote:{symbol}", RESPONSE_CACHE_CONFIG["quote_ttl"], lambda: _get_gold_quote(symbol))
+
+def _get_gold_quote(symbol: str) -> GoldQuoteResponse:
     try:
         quote = gold_client.get_latest_quote(symbol)
         
@@ -619,15 +845,11 @@ async def get_gold_quote(symbol: str):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in get_gold_quote: {e}")
+        logger.error("Error in get_gold_quote: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/gold/history/{symbol}", response_model=GoldHistoryResponse, tags=["Gold"])
-async def get_gold_history(
-    symbol: str,
-    start_date: str = Query(None, description="Start date in YYYY-MM-DD format (default: 1 year ago)"),
-    end_date: str = Query(None, description="End date in YYYY-MM-DD format (default: today)")
-):
+def get_gold_history(request: Request, symbol: str = Depends(normalized_symbol), dates: Tuple[str, str] = Depends(history_date_range)):
     """
     Get historical gold price data for a specific provider.
     
@@ -655,138 +877,127 @@ async def get_gold_history(
         404: Provider symbol not found or no history available
         500: API error
     """
-    try:
-        start_date, end_date = validate_and_set_dates(start_date, end_date, allow_future_dates=False)
-
-        history = gold_client.get_gold_history(symbol, start_date, end_date)
-        
-        if not history:
-            raise HTTPException(
-                status_code=404,
-                detail=f"No history found for {symbol}"
-            )
-        
-        return GoldHistoryResponse(
-            symbol=symbol,
-            history=history
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error in get_gold_history: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    validate_client_available(gold_client, "Gold")
+    start_date, end_date = dates
+    return _history_response(
+        request, f"gold_history:{symbol}:{start_date}:{end_date}",
+        lambda: _history(gold_client.get_gold_history, ASSET_TYPE_GOLD, symbol, start_date, end_date)
+    )
 
 @app.get("/search", response_model=SearchResponse)
 async def search_assets(
-    query: str = Query(..., description="Search query by symbol or name for stocks, funds, indices, or gold"),
+    nq: NormalizedQuery = Depends(normalized_query),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of results to return (default: 20)")
 ):
+    cache_key = f"search:{nq.upper}:{limit}"
+    cached_body = response_cache.get(cache_key)
+    if cached_body is not None:
+        return _tagged_response(cached_body)
+
+    # Concurrent misses for the same query and limit share one fan-out
+    body = await async_single_flight.do(cache_key, lambda: _search_assets_body(nq, limit, cache_key))
+    return _tagged_response(body)
+
+async def _search_assets_body(nq: NormalizedQuery, limit: int, cache_key: str) -> bytes:
+    query, query_upper, query_lower = nq.raw, nq.upper, nq.lower
     try:
-        # Define async search functions for parallel execution
+        loop = asyncio.get_running_loop()
+
+        # Define async search functions for parallel execution; blocking client
+        # calls run on the search pool so the sub-searches overlap
         async def search_stocks():
             try:
-                query_upper = query.upper()
-                query_lower = query.lower()
                 results = []
+                seen = set()
                 
-                # Search by symbol (exact match)
-                stock_info = stock_client.search_stock(query_upper)
+                # Exact symbol match and partial name match are independent, so overlap them
+                stock_info, stocks = await asyncio.gather(
+                    loop.run_in_executor(_search_pool, stock_client.search_stock, query_upper),
+                    loop.run_in_executor(_search_pool, stock_client.search_stocks_by_name, query_lower, 10)
+                )
                 if stock_info:
-                    results.append(ResponseValidator.enrich_search_result({
+                    seen.add(stock_info["symbol"])
+                    results.append({
+                        **_STOCK_DESCRIPTOR,
                         "symbol": stock_info["symbol"],
                         "name": stock_info["company_name"],
                         "exchange": stock_info.get("exchange", "")
-                    }, ASSET_TYPE_STOCK))
+                    })
 
-                # Search by name (partial match)
-                stocks = stock_client.search_stocks_by_name(query_lower, limit=10)
+                # Name matches after the exact hit
                 for stock in stocks:
                     # Avoid duplicates
-                    if not any(r["symbol"] == stock["symbol"] for r in results):
-                        results.append(ResponseValidator.enrich_search_result({
-                            "symbol": stock["symbol"],
-                            "name": stock["company_name"],
-                            "exchange": stock.get("exchange", "")
-                        }, ASSET_TYPE_STOCK))
+                    if stock["symbol"] in seen:
+                        continue
+                    seen.add(stock["symbol"])
+                    results.append({
+                        **_STOCK_DESCRIPTOR,
+                        "symbol": stock["symbol"],
+                        "name": stock["company_name"],
+                        "exchange": stock.get("exchange", "")
+                    })
                 
                 return results
             except Exception as e:
-                logger.debug(f"Error searching stocks: {e}")
+                logger.debug("Error searching stocks: %s", e)
                 return []
         
         async def search_funds():
             try:
-                query_lower = query.lower()
-                query_upper = query.upper()
                 results = []
                 
-                funds = fund_client.search_funds_by_name(query_lower, limit=10)
+                funds = await loop.run_in_executor(_search_pool, fund_client.search_funds_by_name, query_lower, 10)
                 for fund in funds:
-                    results.append(ResponseValidator.enrich_search_result({
+                    results.append({
+                        **_FUND_DESCRIPTOR,
                         "symbol": fund["symbol"],
                         "name": fund["fund_name"],
                         "exchange": "VN"
-                    }, ASSET_TYPE_FUND))
+                    })
                 
                 return results
             except Exception as e:
-                logger.debug(f"Error searching funds: {e}")
+                logger.debug("Error searching funds: %s", e)
                 return []
         
         async def search_indices():
             try:
-                query_upper = query.upper()
-                results = []
-                
-                indices = INDEX_SYMBOLS
-                for idx in indices:
-                    if query_upper == idx or query_upper in idx or idx in query_upper:
-                        results.append(ResponseValidator.enrich_search_result({
-                            "symbol": idx,
-                            "name": f"Vietnam {idx} Index"
-                        }, ASSET_TYPE_INDEX))
-                
-                return results
+                # Shared records; ranking reads them without modifying
+                return [
+                    _INDEX_RECORDS[idx]
+                    for idx in INDEX_SYMBOLS_ORDER
+                    if query_upper in idx or idx in query_upper
+                ]
             except Exception as e:
-                logger.debug(f"Error searching indices: {e}")
+                logger.debug("Error searching indices: %s", e)
                 return []
         
         async def search_gold():
             try:
-                query_upper = query.upper()
-                query_lower = query.lower()
                 results = []
                 
                 # Check for gold-related queries
-                gold_patterns = ["gold", "vn gold", "vn_gold", "vngold", "sjc", "btmc", "msn"]
-                query_normalized = query_lower.replace("_", " ").replace("-", " ").strip()
-                is_gold_query = query_normalized == "gold" or any(pattern in query_normalized for pattern in gold_patterns)
+                is_gold_query = GOLD_QUERY_RE.search(query) is not None
                 
                 if is_gold_query:
-                    gold_providers = gold_client.get_all_gold_providers()
-                    for provider in gold_providers:
-                        results.append(ResponseValidator.enrich_search_result({
-                            "symbol": provider["symbol"],
-                            "name": provider["name"],
-                            "asset_type": provider["asset_type"],
-                            "exchange": provider["exchange"],
-                            "currency": provider["currency"]
-                        }, ASSET_TYPE_GOLD))
+                    # Shared records; ranking reads them without modifying
+                    results.extend(_gold_provider_records())
                 else:
                     # Try to match specific gold symbol
-                    gold_info = gold_client.search_gold(query_upper)
+                    gold_info = await loop.run_in_executor(_search_pool, gold_client.search_gold, query_upper)
                     if gold_info:
-                        results.append(ResponseValidator.enrich_search_result({
+                        results.append({
+                            **_GOLD_DESCRIPTOR,
                             "symbol": gold_info["symbol"],
                             "name": gold_info["name"],
                             "asset_type": gold_info["asset_type"],
                             "exchange": gold_info["exchange"],
                             "currency": gold_info["currency"]
-                        }, ASSET_TYPE_GOLD))
+                        })
                 
                 return results
             except Exception as e:
-                logger.debug(f"Error searching gold: {e}")
+                logger.debug("Error searching gold: %s", e)
                 return []
         
         # Use optimized search with caching and parallel execution
@@ -798,7 +1009,7 @@ async def search_assets(
         }
         
         # Execute optimized search
-        combined_results = await search_optimizer.optimized_search(
+        combined_results, complete = await search_optimizer.optimized_search(
             query=query,
             search_functions=search_functions,
             limit=limit,
@@ -807,7 +1018,7 @@ async def search_assets(
         
         # Convert to SearchResult objects
         search_results = [
-            SearchResult(
+            SearchResult.model_construct(
                 symbol=result["symbol"],
                 name=result["name"],
                 asset_type=result["asset_type"],
@@ -820,161 +1031,128 @@ async def search_assets(
             for result in combined_results[:limit]
         ]
         
-        return SearchResponse(results=search_results, total=len(search_results))
+        body = serialize_response(SearchResponse.model_construct(results=search_results, total=len(search_results)))
+        # Partial results (a backend timed out) are served once but not cached
+        if complete:
+            response_cache.set(cache_key, body, RESPONSE_CACHE_CONFIG["search_ttl"])
+        return body
     except Exception as e:
-        logger.error(f"Error in search_assets: {e}")
+        logger.error("Error in search_assets: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/history/{symbol}")
-async def get_history(
-    symbol: str,
-    start_date: str = Query(None, description="Start date in YYYY-MM-DD format"),
-    end_date: str = Query(None, description="End date in YYYY-MM-DD format")
-):
+def get_history(request: Request, symbol: str = Depends(normalized_symbol), dates: Tuple[str, str] = Depends(history_date_range)):
+    start_date, end_date = dates
+    # Rendering here keeps orjson serialization of large histories on the worker thread;
+    # a plain dict return would be encoded on the event loop
+    return _history_response(
+        request, f"history:{symbol}:{start_date}:{end_date}",
+        lambda: _get_history(symbol, start_date, end_date)
+    )
+
+def _quote_history_record(symbol: str, quote: dict) -> dict:
+    """Convert a latest stock/index quote into a history row."""
+    return {
+        "symbol": symbol,
+        "date": quote.get('date'),
+        "nav": quote.get('close', quote.get('nav')),
+        "open": quote.get('open'),
+        "high": quote.get('high'),
+        "low": quote.get('low'),
+        "close": quote.get('close'),
+        "adjclose": quote.get('adjclose'),
+        "volume": quote.get('volume')
+    }
+
+def _merge_today(history_data: list, record: Optional[dict], today: str, asset_type: str) -> None:
+    """Append today's record to history_data unless the history already covers today."""
+    if not record or record.get('date') != today:
+        return
+    record = _history_row(record, _HISTORY_ROW_FIELDS[asset_type])
+    # Ascending history ending before today: appending keeps it sorted, no scan needed
+    if not history_data or (history_data[-1].get('date') or '') < today:
+        history_data.append(record)
+        return
+    if any(row.get('date') == today for row in history_data):
+        return
+    history_data.append(record)
+    history_data.sort(key=lambda x: x.get('date') or '')
+
+def _get_history(symbol: str, start_date: str, end_date: str) -> dict:
     try:
         symbol = symbol.upper()
-        start_date, end_date = validate_and_set_dates(start_date, end_date, allow_future_dates=False)
-        # Detect asset type and route to appropriate endpoint
-        asset_type = AssetTypeDetector.detect_asset_type(symbol, {
-            'fund_client': fund_client,
-            'gold_client': gold_client
-        })
+        # Detect asset type and route to the same helpers the per-asset endpoints use
+        asset_type = _detect_asset_type(symbol)
 
         # Check if we should include today's latest quote
-        today = datetime.now().strftime("%Y-%m-%d")
-        should_include_today = (end_date == today or end_date >= today)
+        today = today_str()
+        should_include_today = end_date >= today
 
         if asset_type == ASSET_TYPE_GOLD:
-            history = gold_client.get_gold_history(symbol, start_date, end_date)
-            if history:
-                # For gold, the history method should already include today's data if available
-                return ResponseValidator.enrich_response_with_classification({
-                    "symbol": symbol,
-                    "history": history
-                }, ASSET_TYPE_GOLD)
+            # For gold, the history method should already include today's data if available;
+            # provider symbols are never stock tickers, so there is no stock fallback
+            history = _fetch_history(gold_client.get_gold_history, symbol, start_date, end_date)
+            return _history_payload(symbol, history, ASSET_TYPE_GOLD)
 
         elif asset_type == ASSET_TYPE_INDEX:
-            result = await get_index_history(symbol, start_date, end_date)
-            history_data = [item.dict() for item in result.history]
+            history_data = list(_fetch_history(index_client.get_index_history, symbol, start_date, end_date, "index "))
 
-            # Check if we need to include today's latest quote for index
             if should_include_today and index_client:
                 try:
                     latest_quote = index_client.get_latest_quote(symbol)
-                    if latest_quote and latest_quote.get('date') == today:
-                        # Check if today's data is already in history
-                        has_today = any(record.get('date') == today for record in history_data)
-                        if not has_today:
-                            # Convert latest quote to history format
-                            history_record = {
-                                "symbol": symbol,
-                                "date": latest_quote.get('date'),
-                                "nav": latest_quote.get('close', latest_quote.get('nav')),
-                                "open": latest_quote.get('open'),
-                                "high": latest_quote.get('high'),
-                                "low": latest_quote.get('low'),
-                                "close": latest_quote.get('close'),
-                                "adjclose": latest_quote.get('adjclose'),
-                                "volume": latest_quote.get('volume')
-                            }
-                            history_data.append(history_record)
-                            # Sort by date
-                            history_data.sort(key=lambda x: x.get('date', ''), reverse=False)
+                    if latest_quote:
+                        _merge_today(history_data, _quote_history_record(symbol, latest_quote), today, ASSET_TYPE_INDEX)
                 except Exception as e:
-                    logger.debug(f"Could not include today's quote for {symbol}: {e}")
+                    logger.debug("Could not include today's quote for %s: %s", symbol, e)
 
-            return ResponseValidator.enrich_response_with_classification({
-                "symbol": result.symbol,
-                "history": history_data,
-                "currency": result.currency,
-                "data_source": result.data_source
-            }, ASSET_TYPE_INDEX)
+            return _history_payload(symbol, history_data, ASSET_TYPE_INDEX)
 
         elif asset_type == ASSET_TYPE_FUND:
-            fund_symbols = [f["symbol"] for f in fund_client.get_funds_list()]
-            if symbol in fund_symbols:
-                result = await get_fund_history(symbol, start_date, end_date)
-                history_data = [item.dict() for item in result.history]
+            if symbol in fund_client.get_fund_symbols():
+                history_data = list(_fetch_history(fund_client.get_fund_nav_history, symbol, start_date, end_date))
                 
                 # Only fetch latest quote if after market close (16:00) on weekdays
-                from app.utils.market_time_utils import is_after_market_close
-                
                 if is_after_market_close():
                     try:
-                        latest_quote = fund_client.get_latest_nav(symbol)
-                        if latest_quote and latest_quote.get('date') == today:
-                            # Check if today's data is already in history
-                            has_today = any(record.get('date') == today for record in history_data)
-                            if not has_today:
-                                history_data.append(latest_quote)
-                                # Sort by date
-                                history_data.sort(key=lambda x: x.get('date', ''), reverse=False)
+                        _merge_today(history_data, fund_client.get_latest_nav(symbol), today, ASSET_TYPE_FUND)
                     except Exception as e:
-                        logger.debug(f"Could not include today's quote for {symbol}: {e}")
+                        logger.debug("Could not include today's quote for %s: %s", symbol, e)
                 else:
-                    logger.debug(f"Skipping latest quote fetch for {symbol} - before market close (16:00) or weekend")
+                    logger.debug("Skipping latest quote fetch for %s - before market close (16:00) or weekend", symbol)
 
-                return ResponseValidator.enrich_response_with_classification({
-                    "symbol": result.symbol,
-                    "history": history_data,
-                    "currency": result.currency,
-                    "data_source": result.data_source
-                }, ASSET_TYPE_FUND)
+                return _history_payload(symbol, history_data, ASSET_TYPE_FUND)
 
         # Default to stock
-        result = await get_stock_history(symbol, start_date, end_date)
-        history_data = [item.dict() for item in result.history]
+        history_data = list(_fetch_history(stock_client.get_stock_history, symbol, start_date, end_date))
 
-        # Check if we need to include today's latest quote for stock
         if should_include_today and stock_client:
             try:
                 latest_quote = stock_client.get_latest_quote(symbol)
-
-                if latest_quote and latest_quote.get('date') == today:
-
-                    # Check if today's data is already in history
-                    has_today = any(record.get('date') == today for record in history_data)
-
-                    if not has_today:
-                        # Convert latest quote to history format
-                        history_record = {
-                            "symbol": symbol,
-                            "date": latest_quote.get('date'),
-                            "nav": latest_quote.get('close', latest_quote.get('nav')),
-                            "open": latest_quote.get('open'),
-                            "high": latest_quote.get('high'),
-                            "low": latest_quote.get('low'),
-                            "close": latest_quote.get('close'),
-                            "adjclose": latest_quote.get('adjclose'),
-                            "volume": latest_quote.get('volume')
-                        }
-                        history_data.append(history_record)
-                        # Sort by date
-                        history_data.sort(key=lambda x: x.get('date', ''), reverse=False)
-                    else:
-                        logger.info(f"DEBUG: Today's data already exists in history for {symbol}")
-                else:
-                    logger.info(f"DEBUG: Latest quote date doesn't match today or quote is None: date={latest_quote.get('date') if latest_quote else None}, today={today}")
+                if latest_quote:
+                    _merge_today(history_data, _quote_history_record(symbol, latest_quote), today, ASSET_TYPE_STOCK)
             except Exception as e:
-                logger.error(f"DEBUG: Could not include today's quote for {symbol}: {e}")
-                import traceback
-                logger.error(f"DEBUG: Traceback: {traceback.format_exc()}")
+                logger.debug("Could not include today's quote for %s: %s", symbol, e, exc_info=True)
 
-        return ResponseValidator.enrich_response_with_classification({
-            "symbol": result.symbol,
-            "history": history_data,
-            "currency": result.currency,
-            "data_source": result.data_source
-        }, ASSET_TYPE_STOCK)
+        return _history_payload(symbol, history_data, ASSET_TYPE_STOCK)
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in get_history: {e}")
+        logger.error("Error in get_history: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
+def _quote_payload(result, asset_type: str) -> dict:
+    """Dump a quote model for /quote, tagged with its asset type.
+
+    The quote models already default the classification fields, so one dump
+    plus the asset_type key is all re-enrichment would have produced.
+    """
+    payload = result.model_dump()
+    payload["asset_type"] = asset_type
+    return payload
+
 @app.get("/quote/{symbol}")
-async def get_quote(symbol: str):
+def get_quote(symbol: str = Depends(normalized_symbol)):
     """
     Universal quote endpoint - auto-detects asset type and returns latest price data.
 
@@ -994,159 +1172,307 @@ async def get_quote(symbol: str):
         - currency: Pricing currency
         - data_source: Data source identifier
     """
+    return _cached_response(f"quote:{symbol}", RESPONSE_CACHE_CONFIG["quote_ttl"], lambda: _get_quote(symbol))
+
+def _get_quote(symbol: str) -> dict:
     try:
-        symbol = symbol.upper()
-        logger.info(f"DEBUG: Quote request for {symbol}")
+        logger.debug("Quote request for %s", symbol)
 
         # Detect asset type and route to appropriate endpoint
-        asset_type = AssetTypeDetector.detect_asset_type(symbol, {
-            'fund_client': fund_client,
-            'gold_client': gold_client
-        })
+        asset_type = _detect_asset_type(symbol)
 
         if asset_type == ASSET_TYPE_GOLD:
             quote = gold_client.get_latest_quote(symbol)
-            if quote:
-                return ResponseValidator.enrich_response_with_classification({
-                    **quote,
-                    "asset_type": ASSET_TYPE_GOLD
-                }, ASSET_TYPE_GOLD)
+            if not quote:
+                # Gold provider symbols are never stock tickers; skip the stock fallback
+                raise HTTPException(status_code=404, detail=f"Quote for {symbol} not found")
+            return ResponseValidator.enrich_response_with_classification({
+                **quote,
+                "asset_type": ASSET_TYPE_GOLD
+            }, ASSET_TYPE_GOLD)
 
         elif asset_type == ASSET_TYPE_INDEX:
-            result = await get_index_quote(symbol)
-            return ResponseValidator.enrich_response_with_classification({
-                **result.dict(),
-                "asset_type": ASSET_TYPE_INDEX
-            }, ASSET_TYPE_INDEX)
+            result = _get_index_quote(symbol)
+            return _quote_payload(result, ASSET_TYPE_INDEX)
 
         elif asset_type == ASSET_TYPE_FUND:
             if fund_client:
-                fund_symbols = [f["symbol"] for f in fund_client.get_funds_list()]
-                if symbol in fund_symbols:
-                    result = await get_fund_quote(symbol)
-                    return ResponseValidator.enrich_response_with_classification({
-                        **result.dict(),
-                        "asset_type": ASSET_TYPE_FUND
-                    }, ASSET_TYPE_FUND)
+                if symbol in fund_client.get_fund_symbols():
+                    result = _get_fund_quote(symbol)
+                    return _quote_payload(result, ASSET_TYPE_FUND)
 
         # Default to stock
-        result = await get_stock_quote(symbol)
-        logger.info(f"DEBUG: Quote endpoint returning for stock: {result.dict()}")
-        return ResponseValidator.enrich_response_with_classification({
-            **result.dict(),
-            "asset_type": ASSET_TYPE_STOCK
-        }, ASSET_TYPE_STOCK)
+        result = _get_stock_quote(symbol)
+        logger.debug("Quote endpoint returning for stock: %s", result)
+        return _quote_payload(result, ASSET_TYPE_STOCK)
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in get_quote: {e}")
+        logger.error("Error in get_quote: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/quotes")
+async def get_quotes(
+    symbols: str = Query(..., max_length=2000, description="Comma-separated symbols, e.g. VNM,FPT,VNINDEX,VN_GOLD_SJC")
+):
+    """
+    Bulk quote endpoint - /quote/{symbol} for several symbols in one round trip.
+
+    Returns an object keyed by upper-cased symbol. Each value is the same body
+    /quote/{symbol} returns, or {"error", "status_code"} for a symbol that failed.
+    Quotes are fetched concurrently and share the /quote response cache.
+    """
+    requested = list(dict.fromkeys(s.strip().upper() for s in symbols.split(",") if s.strip()))
+    if not requested:
+        raise HTTPException(status_code=400, detail="No symbols given")
+    max_symbols = BULK_QUOTE_CONFIG["max_symbols"]
+    if len(requested) > max_symbols:
+        raise HTTPException(status_code=400, detail=f"At most {max_symbols} symbols per request")
+
+    bodies = await asyncio.gather(*(asyncio.to_thread(_bulk_quote_body, symbol) for symbol in requested))
+    # Splice the cached per-symbol bodies instead of decoding and re-encoding them
+    entries = b",".join(serialize_response(symbol) + b":" + body for symbol, body in zip(requested, bodies))
+    return Response(content=b"{" + entries + b"}", media_type="application/json")
+
+def _bulk_quote_body(symbol: str) -> bytes:
+    """One /quotes entry: the cached /quote body for symbol, or an error object."""
+    if not _SYMBOL_RE.match(symbol):
+        return serialize_response({"error": f"Invalid symbol {symbol}", "status_code": 422})
+    try:
+        return _cached_body(f"quote:{symbol}", RESPONSE_CACHE_CONFIG["quote_ttl"], lambda: _get_quote(symbol))
+    except HTTPException as e:
+        return serialize_response({"error": e.detail, "status_code": e.status_code})
+
 @app.get("/search/{symbol}", response_model=SearchResult)
-async def search_asset(symbol: str):
-    logger.info(f"search_asset called with symbol: {symbol}")
+def search_asset(request: Request, symbol: str = Depends(normalized_symbol)):
+    body = _symbol_search_body(symbol)
+    if body is None:
+        # Unknown symbols are common under scanning; answer without raising
+        return ORJSONResponse({"detail": f"Asset {symbol} not found"}, status_code=404)
+    return _conditional_response(request, body, HTTP_CACHE_CONFIG["search_max_age"])
+
+def _symbol_search_body(symbol: str) -> Optional[bytes]:
+    """Return the cached SearchResult body for symbol, resolving it on a miss; None if unknown."""
+    body = symbol_search_cache.get(symbol)
+    if body is None:
+        # Concurrent misses for the same symbol share one resolution
+        body = single_flight.do(f"symbol_search:{symbol}", lambda: _build_symbol_search_body(symbol))
+    return body
+
+def _build_symbol_search_body(symbol: str) -> Optional[bytes]:
+    result_dict = _search_asset(symbol)
+    if result_dict is None:
+        return None
+    # Fields come from trusted descriptors, so skip validation but keep the
+    # documented SearchResult field set and order
+    body = serialize_response(SearchResult.model_construct(**result_dict))
+    symbol_search_cache.set(symbol, body)
+    return body
+
+def _search_asset(symbol: str) -> Optional[dict]:
     try:
         symbol_upper = symbol.upper()
-        logger.info(f"Processing symbol: {symbol_upper}")
 
         # Detect asset type and route to appropriate search
-        asset_type = AssetTypeDetector.detect_asset_type(symbol_upper, {
-            'fund_client': fund_client,
-            'gold_client': gold_client
-        })
+        asset_type = _detect_asset_type(symbol_upper)
 
         result_dict = None
 
         if asset_type == ASSET_TYPE_GOLD:
             gold_info = gold_client.search_gold(symbol)
             if gold_info:
-                result_dict = ResponseValidator.enrich_response_with_classification({
+                result_dict = {
+                    **_GOLD_DESCRIPTOR,
                     "symbol": gold_info["symbol"],
                     "name": gold_info["name"],
                     "asset_type": gold_info["asset_type"],
                     "exchange": gold_info["exchange"],
                     "currency": gold_info["currency"]
-                }, ASSET_TYPE_GOLD)
+                }
 
         elif asset_type == ASSET_TYPE_INDEX:
-            result_dict = ResponseValidator.enrich_response_with_classification({
+            result_dict = {
+                **_INDEX_DESCRIPTOR,
                 "symbol": symbol_upper,
                 "name": f"Vietnam {symbol_upper} Index",
-                "asset_type": ASSET_TYPE_INDEX,
                 "exchange": "HOSE" if symbol_upper.startswith("VN") else "HNX"
-            }, ASSET_TYPE_INDEX)
+            }
 
         elif asset_type == ASSET_TYPE_FUND:
-            fund_info = fund_client.search_fund_by_symbol(symbol_upper)
+            # The listing already has the name; no NAV report fetch needed
+            fund_info = fund_client.get_fund_listing(symbol_upper)
             if fund_info:
-                result_dict = ResponseValidator.enrich_response_with_classification({
+                result_dict = {
+                    **_FUND_DESCRIPTOR,
                     "symbol": fund_info["symbol"],
-                    "name": fund_info["fund_name"],
-                    "asset_type": ASSET_TYPE_FUND,
-                    "exchange": "VN"
-                }, ASSET_TYPE_FUND)
+                    "name": fund_info["fund_name"]
+                }
 
         else:  # Default to stock
             stock_info = stock_client.search_stock(symbol_upper)
             if stock_info:
-                logger.info(f"Found stock info for {symbol_upper}: {stock_info}")
-                result_dict = ResponseValidator.enrich_response_with_classification({
+                result_dict = {
+                    **_STOCK_DESCRIPTOR,
                     "symbol": stock_info["symbol"],
                     "name": stock_info["company_name"],
-                    "asset_type": ASSET_TYPE_STOCK,
                     "exchange": stock_info.get("exchange", "")
-                }, ASSET_TYPE_STOCK)
-
-        if result_dict is None:
-            raise HTTPException(status_code=404, detail=f"Asset {symbol} not found")
-
-        # Validate the response
-        if not ResponseValidator.validate_response_fields(result_dict, asset_type):
-            logger.warning(f"Validation failed for asset {symbol}")
+                }
 
-        logger.info(f"Returning SearchResult: {result_dict}")
+        # Classification fields come from the prebuilt descriptors, so the
+        # result needs no per-request field validation
         return result_dict
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in search_asset: {e}")
+        logger.error("Error in search_asset: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
+async def _warm_clients():
+    """Load fund and stock listings before serving, concurrently and each bounded by the warm-up timeout."""
+    timeout_seconds = TIMEOUT_CONFIG["warmup_timeout_seconds"]
+    warmups = []
+    if fund_client:
+        warmups.append(("fund listing", fund_client.get_funds_list))
+    if stock_client:
+        warmups.append(("stock listing", stock_client._get_companies_df))
+
+    async def warm_one(name: str, warm) -> None:
+        try:
+            await wait_for(asyncio.to_thread(warm), timeout=timeout_seconds)
+            logger.info("Warmed %s", name)
+        except TimeoutError:
+            logger.warning("Warming %s exceeded %ss, continuing startup", name, timeout_seconds)
+        except Exception as e:
+            logger.warning("Could not warm %s: %s", name, e)
+
+    # The listings come from different upstreams, so startup waits for the slower one, not both
+    await asyncio.gather(*(warm_one(name, warm) for name, warm in warmups))
+
+async def _warm_symbol_search():
+    """Fill the /search/{symbol} cache for indices, gold, all funds and popular stocks."""
+    symbols = [*INDEX_SYMBOLS_ORDER, *GOLD_PROVIDERS, *SYMBOL_SEARCH_CACHE_CONFIG["warm_stocks"]]
+    if fund_client:
+        try:
+            symbols.extend(sorted(await asyncio.to_thread(fund_client.get_fund_symbols)))
+        except Exception as e:
+            logger.warning("Could not load fund symbols for warm-up: %s", e)
+
+    semaphore = asyncio.Semaphore(SYMBOL_SEARCH_CACHE_CONFIG["warm_concurrency"])
+
+    async def warm(symbol: str) -> bool:
+        async with semaphore:
+            try:
+                return await asyncio.to_thread(_symbol_search_body, symbol) is not None
+            except Exception as e:
+                logger.debug("Could not warm symbol lookup for %s: %s", symbol, e)
+                return False
+
+    results = await asyncio.gather(*(warm(symbol) for symbol in symbols))
+    logger.info("Warmed %d/%d symbol lookups", sum(results), len(results))
+
+async def _warm_quotes():
+    """Fill the client quote caches for indices, gold and the first listed funds."""
+    symbols = list(QUOTE_WARMUP_CONFIG["symbols"])
+    if fund_client:
+        try:
+            funds = await asyncio.to_thread(fund_client.get_funds_list)
+            symbols.extend(fund["symbol"] for fund in funds[:QUOTE_WARMUP_CONFIG["fund_count"]])
+        except Exception as e:
+            logger.warning("Could not load funds for quote warm-up: %s", e)
+
+    semaphore = asyncio.Semaphore(QUOTE_WARMUP_CONFIG["warm_concurrency"])
+
+    async def warm(symbol: str) -> bool:
+        async with semaphore:
+            try:
+                await asyncio.to_thread(_get_quote, symbol)
+                return True
+            except Exception as e:
+                logger.debug("Could not warm quote for %s: %s", symbol, e)
+                return False
+
+    results = await asyncio.gather(*(warm(symbol) for symbol in symbols))
+    logger.info("Warmed %d/%d quotes", sum(results), len(results))
+
+# References to the startup tasks so they are not garbage collected mid-run
+_startup_task: Optional[asyncio.Task] = None
+_symbol_warmup_task: Optional[asyncio.Task] = None
+_quote_warmup_task: Optional[asyncio.Task] = None
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize background tasks on startup."""
+    # Blocking route handlers are plain `def` and run on Starlette's threadpool;
+    # size it for slow provider calls rather than the 40-token default
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_CONFIG["max_workers"]
+    # asyncio.to_thread (listing refreshes, warm-ups, persistent search cache)
+    # uses the loop's default executor; give it the same headroom
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=THREADPOOL_CONFIG["max_workers"], thread_name_prefix="io")
+    )
+
+    # Build the OpenAPI schema now instead of on the first /openapi.json or /docs hit;
+    # FastAPI keeps the result on app.openapi_schema
+    app.openapi()
+
+    # Seeding and warm-up run after startup returns, so uvicorn binds the port
+    # immediately; /health/ready reports when they are done
+    global _startup_task
+    _startup_task = asyncio.create_task(_prepare_caches())
+
+async def _prepare_caches():
+    """Seed the asset cache, warm the listings and start background cache maintenance."""
     try:
         # First, seed the cache with all available assets
         logger.info("Starting cache seeding on startup...")
         counts = await data_seeder.seed_all_assets(force_refresh=False)
-        logger.info(f"Initial seeding completed: {counts}")
+        logger.info("Initial seeding completed: %s", counts)
         
         # Note: Gold static seeding can be triggered manually via /gold/seed endpoint
         # This avoids startup delays and allows seeding when needed
         logger.info("Gold static seeding available via /gold/seed endpoint")
         
-        # Note: Not refreshing popular asset quotes on startup to avoid delays
-        # Quotes will be fetched on-demand when accessed
+        # Load the listings that routing and search depend on (seeding skips them on a warm DB)
+        await _warm_clients()
         
         # Start background cache tasks
-        await start_cache_background_tasks(cache_manager, stock_client, fund_client, gold_client)
+        await start_cache_background_tasks(cache_manager, stock_client, fund_client, gold_client, data_seeder)
         logger.info("Background cache tasks started successfully")
+
+        # Warm symbol lookups and hot quotes separately so readiness is not delayed
+        global _symbol_warmup_task, _quote_warmup_task
+        _symbol_warmup_task = asyncio.create_task(_warm_symbol_search())
+        if QUOTE_WARMUP_CONFIG["enabled"]:
+            _quote_warmup_task = asyncio.create_task(_warm_quotes())
     except Exception as e:
-        logger.error(f"Error during startup: {e}")
+        logger.error("Error during startup: %s", e)
         # Continue startup even if seeding fails
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up background tasks on shutdown."""
+    for task in (_startup_task, _symbol_warmup_task, _quote_warmup_task):
+        if task is not None and not task.done():
+            task.cancel()
+
+    timeout_seconds = TIMEOUT_CONFIG["shutdown_timeout_seconds"]
     try:
-        await stop_cache_background_tasks()
+        await wait_for(stop_cache_background_tasks(), timeout=timeout_seconds)
         logger.info("Background cache tasks stopped successfully")
+    except TimeoutError:
+        logger.warning("Stopping background tasks exceeded %ss, continuing shutdown", timeout_seconds)
     except Exception as e:
-        logger.error(f"Error stopping background tasks: {e}")
+        logger.error("Error stopping background tasks: %s", e)
 
 if __name__ == "__main__":
     import uvicorn
-    logger.info(f"Starting Vietnamese Market Data Service on {HOST}:{PORT}")
-    uvicorn.run(app, host=HOST, port=PORT)
+    logger.info("Starting Vietnamese Market Data Service on %s:%s (%d worker(s))", HOST, PORT, WORKERS)
+    # uvicorn can only fork workers from an import string; "auto" uses uvloop and
+    # httptools where installed and falls back to asyncio/h11 (e.g. on Windows)
+    uvicorn.run(
+        "app.main:app" if WORKERS > 1 else app,
+        host=HOST, port=PORT, workers=WORKERS,
+        loop="auto", http="auto", access_log=False
+    )
@@ -2,10 +2,10 @@
 Asset type detection utilities to eliminate duplicated logic in universal endpoints.
 """
 
+import sys
 from typing import Optional, Dict, Any
 from app.constants import (
-    INDEX_SYMBOLS,
-    GOLD_PROVIDERS,
+    classify_symbol,
     ASSET_TYPE_INDEX,
     ASSET_TYPE_GOLD,
     ASSET_TYPE_FUND,
@@ -23,26 +23,27 @@ class AssetTypeDetector:
 
         Args:
             symbol: The symbol to analyze
-            clients: Dictionary of client instances for validation
+            clients: Dictionary of client instances for validation, optionally with an
+                'asset_type_index' mapping of seeded symbols to asset types
 
         Returns:
             Asset type string (FUND, STOCK, INDEX, GOLD)
         """
-        symbol_upper = symbol.upper()
-
-        # Check indices first (fastest check)
-        if symbol_upper in INDEX_SYMBOLS:
-            return ASSET_TYPE_INDEX
+        symbol_upper = sys.intern(symbol.upper())
 
-        # Check gold providers
-        if symbol_upper in GOLD_PROVIDERS:
-            return ASSET_TYPE_GOLD
+        # Known index and gold provider symbols (single lookup). Gold is dispatched only
+        # for provider symbols: the gold client rejects anything else via ValueError.
+        known_type = classify_symbol(symbol_upper, default=None)
+        if known_type is not None:
+            return known_type
 
-        # Check gold patterns (more flexible)
-        gold_patterns = ["gold", "vn gold", "vn_gold", "vngold", "sjc", "btmc", "msn"]
-        symbol_normalized = symbol_upper.replace("_", " ").replace("-", " ").strip()
-        if any(pattern.upper() in symbol_normalized for pattern in gold_patterns):
-            return ASSET_TYPE_GOLD
+        # Symbols seeded into the asset cache
+        if clients:
+            asset_type_index = clients.get('asset_type_index')
+            if asset_type_index:
+                seeded_type = asset_type_index.get(symbol_upper)
+                if seeded_type is not None:
+                    return seeded_type
 
         # Use clients for validation if available
         if clients:
@@ -50,8 +51,7 @@ class AssetTypeDetector:
             fund_client = clients.get('fund_client')
             if fund_client:
                 try:
-                    fund_symbols = [f["symbol"] for f in fund_client.get_funds_list()]
-                    if symbol_upper in fund_symbols:
+                    if symbol_upper in fund_client.get_fund_symbols():
                         return ASSET_TYPE_FUND
                 except Exception:
                     pass  # Continue with other checks
@@ -75,13 +75,10 @@ class AssetTypeDetector:
     @staticmethod
     def is_index_symbol(symbol: str) -> bool:
         """Check if symbol is an index."""
-        return symbol.upper() in INDEX_SYMBOLS
+        return classify_symbol(symbol.upper(), default=None) == ASSET_TYPE_INDEX
 
     @staticmethod
     def is_gold_symbol(symbol: str) -> bool:
         """Check if symbol is a gold provider."""
         symbol_upper = symbol.upper()
-        return symbol_upper in GOLD_PROVIDERS or any(
-            pattern.upper() in symbol_upper.replace("_", " ").replace("-", " ")
-            for pattern in ["gold", "vn gold", "vn_gold", "vngold", "sjc", "btmc", "msn"]
-        )
+        return classify_symbol(symbol_upper, default=None) == ASSET_TYPE_GOLD
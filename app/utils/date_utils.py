@@ -2,10 +2,63 @@
 Date utility functions to eliminate repeated date validation and default date logic.
 """
 
-from datetime import datetime, timedelta
-from typing import Tuple, Optional
+import calendar
+import re
+import time
+from datetime import date, timedelta
+from typing import Dict, Tuple, Optional
 from fastapi import HTTPException
 
+# ASCII digits only (\d would also admit other Unicode digits); month and day may
+# omit the leading zero, as datetime.strptime("%Y-%m-%d") allowed
+_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})")
+
+# (epoch second, "YYYY-MM-DD") so bursts of requests share one date lookup
+_today_cache: Tuple[int, str] = (0, "")
+
+# (today, days back) -> default start date; only changes when the day rolls over
+_days_back_cache: Dict[Tuple[str, int], str] = {}
+
+
+def today_str() -> str:
+    """Return today's local date as YYYY-MM-DD, recomputed at most once per second."""
+    global _today_cache
+    now_second = int(time.time())
+    cached_second, cached_today = _today_cache
+    if cached_second != now_second:
+        cached_today = date.today().isoformat()
+        _today_cache = (now_second, cached_today)
+    return cached_today
+
+
+def days_before(today: str, days: int) -> str:
+    """Return the YYYY-MM-DD date `days` before today, computed once per day and offset."""
+    key = (today, days)
+    result = _days_back_cache.get(key)
+    if result is None:
+        if len(_days_back_cache) > 32:
+            # Entries for earlier days are never asked for again
+            _days_back_cache.clear()
+        result = (date.fromisoformat(today) - timedelta(days=days)).isoformat()
+        _days_back_cache[key] = result
+    return result
+
+
+def normalize_ymd(value: str) -> Optional[str]:
+    """Return value as a zero-padded YYYY-MM-DD date, or None if it is not a real calendar date."""
+    match = _DATE_RE.fullmatch(value)
+    if not match:
+        return None
+    year, month, day = int(match[1]), int(match[2]), int(match[3])
+    if not (year >= 1 and 1 <= month <= 12 and 1 <= day <= calendar.monthrange(year, month)[1]):
+        return None
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+def is_valid_ymd(value: str) -> bool:
+    """Check that value is a real calendar date in YYYY-MM-DD form without building a datetime."""
+    return normalize_ymd(value) is not None
+
 
 def validate_and_set_dates(
     start_date: Optional[str] = None,
@@ -28,35 +81,34 @@ def validate_and_set_dates(
     Raises:
         HTTPException: If date format is invalid or date is in future when not allowed
     """
+    today = today_str()
+
     # Set default end_date to today
     if not end_date:
-        end_date = datetime.now().strftime("%Y-%m-%d")
+        end_date = today
 
     # Set default start_date to default_days_back ago
     if not start_date:
-        start_date = (datetime.now() - timedelta(days=default_days_back)).strftime("%Y-%m-%d")
+        start_date = days_before(today, default_days_back)
 
-    # Validate date formats
-    try:
-        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-    except ValueError:
+    # Validate date formats, padding 2024-1-5 to 2024-01-05 for providers and cache keys
+    normalized_start, normalized_end = normalize_ymd(start_date), normalize_ymd(end_date)
+    if normalized_start is None or normalized_end is None:
         raise HTTPException(
             status_code=400,
             detail="Invalid date format. Use YYYY-MM-DD"
         )
+    start_date, end_date = normalized_start, normalized_end
 
-    # Check for future dates if not allowed
-    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    # Check for future dates if not allowed (zero-padded ISO dates compare lexically)
     if not allow_future_dates:
         # Allow today and past dates, but not future dates
-        tomorrow = today + timedelta(days=1)
-        if start_dt >= tomorrow:
+        if start_date > today:
             raise HTTPException(
                 status_code=400,
                 detail=f"Start date {start_date} is in the future. Historical data is not available for future dates."
             )
-        if end_dt >= tomorrow:
+        if end_date > today:
             raise HTTPException(
                 status_code=400,
                 detail=f"End date {end_date} is in the future. Historical data is not available for future dates."
@@ -82,5 +134,5 @@ def get_default_quote_dates() -> Tuple[str, str]:
     Returns:
         Tuple of (start_date, end_date)
     """
-    today = datetime.now().strftime("%Y-%m-%d")
+    today = today_str()
     return today, today
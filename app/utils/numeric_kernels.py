@@ -0,0 +1,35 @@
+"""
+Vectorized numeric helpers for converting provider OHLCV frames.
+"""
+
+from typing import Tuple
+import numpy as np
+import pandas as pd
+
+PRICE_COLUMNS = ("open", "high", "low", "close")
+
+
+def scale_ohlcv(df: pd.DataFrame, price_scale: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Scale OHLC prices and fill missing values in a single pass per array.
+
+    Args:
+        df: Provider DataFrame with open/high/low/close/volume columns (any may be missing)
+        price_scale: Multiplier applied to prices (1000 converts shortened VND to VND)
+
+    Returns:
+        Tuple of (prices, volume) where prices has shape (rows, 4) in OHLC order.
+        Missing columns and NaN values become 0.0.
+    """
+    prices = df.reindex(columns=list(PRICE_COLUMNS)).to_numpy(dtype=np.float64, copy=True)
+    if price_scale != 1.0:
+        np.multiply(prices, price_scale, out=prices)
+    np.nan_to_num(prices, copy=False, nan=0.0)
+
+    if "volume" in df.columns:
+        volume = df["volume"].to_numpy(dtype=np.float64)
+        volume = np.nan_to_num(volume, nan=0.0)
+    else:
+        volume = np.zeros(len(df), dtype=np.float64)
+
+    return prices, volume
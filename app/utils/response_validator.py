@@ -5,7 +5,12 @@ Centralized response validation utilities to eliminate duplicated validation log
 import logging
 from typing import Dict, Any, Optional
 from app.constants import (
-    ASSET_CLASSIFICATION,
+    ASSET_TYPE_FROM_NAME,
+    ASSET_CLASS_BY_TYPE,
+    ASSET_SUB_CLASS_BY_TYPE,
+    CURRENCY_BY_TYPE,
+    DATA_SOURCE_BY_TYPE,
+    get_classification,
     ASSET_TYPE_FUND,
     ASSET_TYPE_STOCK,
     ASSET_TYPE_INDEX,
@@ -17,6 +22,16 @@ from app.constants import (
 
 logger = logging.getLogger(__name__)
 
+# Expected (asset_class, asset_sub_class) per asset type name
+_EXPECTED_CLASSIFICATION = {
+    name: (ASSET_CLASS_BY_TYPE[type_id], ASSET_SUB_CLASS_BY_TYPE[type_id])
+    for name, type_id in ASSET_TYPE_FROM_NAME.items()
+}
+
+_REQUIRED_FIELDS = ("asset_class", "asset_sub_class", "currency", "data_source")
+_REQUIRED_FIELD_SET = frozenset(_REQUIRED_FIELDS)
+_VALID_CURRENCIES = frozenset((CURRENCY_VND, CURRENCY_USD))
+
 
 class ResponseValidator:
     """Centralized validator for API responses."""
@@ -38,17 +53,9 @@ class ResponseValidator:
         Returns:
             bool: True if validation passes, False otherwise
         """
-        asset_type = asset_type.upper()
-
-        expected = ASSET_CLASSIFICATION.get(asset_type)
-        if not expected:
-            # For unknown asset types, allow any classification
-            return True
-
-        return (
-            asset_class == expected["asset_class"] and
-            asset_sub_class == expected["asset_sub_class"]
-        )
+        expected = _EXPECTED_CLASSIFICATION.get(asset_type.upper())
+        # For unknown asset types, allow any classification
+        return expected is None or expected == (asset_class, asset_sub_class)
 
     @staticmethod
     def validate_response_fields(
@@ -67,16 +74,11 @@ class ResponseValidator:
         Returns:
             bool: True if validation passes, False otherwise
         """
-        required_fields = ["asset_class", "asset_sub_class", "currency", "data_source"]
-
         # Check that all required fields are present
-        for field in required_fields:
-            if field not in response:
-                if not allow_missing_fields:
-                    logger.warning(f"Missing required field: {field}")
-                    return False
-                else:
-                    continue
+        if not allow_missing_fields and not _REQUIRED_FIELD_SET.issubset(response.keys()):
+            missing = next(field for field in _REQUIRED_FIELDS if field not in response)
+            logger.warning("Missing required field: %s", missing)
+            return False
 
         # Validate asset classification
         if not ResponseValidator.validate_asset_classification(
@@ -84,19 +86,19 @@ class ResponseValidator:
             response.get("asset_class", ""),
             response.get("asset_sub_class", "")
         ):
-            logger.warning(f"Invalid asset classification for {expected_asset_type}")
+            logger.warning("Invalid asset classification for %s", expected_asset_type)
             return False
 
         # Validate currency (should be VND or USD)
         currency = response.get("currency")
-        if currency and currency not in [CURRENCY_VND, CURRENCY_USD]:
-            logger.warning(f"Invalid currency: {currency}")
+        if currency and currency not in _VALID_CURRENCIES:
+            logger.warning("Invalid currency: %s", currency)
             return False
 
         # Validate data_source
         data_source = response.get("data_source")
         if data_source and data_source != DATA_SOURCE_VN_MARKET:
-            logger.warning(f"Invalid data_source: {data_source}")
+            logger.warning("Invalid data_source: %s", data_source)
             return False
 
         return True
@@ -116,19 +118,16 @@ class ResponseValidator:
         Returns:
             The enriched response dictionary
         """
-        asset_type = asset_type.upper()
-        classification = ASSET_CLASSIFICATION.get(asset_type)
+        type_id = ASSET_TYPE_FROM_NAME.get(asset_type.upper())
 
-        if classification:
-            response.update({
-                "asset_class": classification["asset_class"],
-                "asset_sub_class": classification["asset_sub_class"],
-                "data_source": classification["data_source"]
-            })
+        if type_id is not None:
+            response["asset_class"] = ASSET_CLASS_BY_TYPE[type_id]
+            response["asset_sub_class"] = ASSET_SUB_CLASS_BY_TYPE[type_id]
+            response["data_source"] = DATA_SOURCE_BY_TYPE[type_id]
 
             # Set currency if not already set
             if "currency" not in response:
-                response["currency"] = classification["currency"]
+                response["currency"] = CURRENCY_BY_TYPE[type_id]
 
         return response
 
@@ -143,7 +142,8 @@ class ResponseValidator:
         Returns:
             Dictionary with asset_class, asset_sub_class, currency, data_source
         """
-        return ASSET_CLASSIFICATION.get(asset_type.upper(), {})
+        classification = get_classification(asset_type.upper())
+        return classification._asdict() if classification else {}
 
     @staticmethod
     def enrich_search_result(result_dict: Dict[str, Any], asset_type: str) -> Dict[str, Any]:
@@ -157,8 +157,6 @@ class ResponseValidator:
         Returns:
             The enriched search result dictionary
         """
-        from app.constants import ASSET_TYPE_FUND, ASSET_TYPE_STOCK, ASSET_TYPE_INDEX, ASSET_TYPE_GOLD
-
         # Set asset_type if not present
         if "asset_type" not in result_dict:
             result_dict["asset_type"] = asset_type
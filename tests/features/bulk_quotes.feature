@@ -0,0 +1,36 @@
+Feature: Bulk Quotes
+  As a Wealthfolio user
+  I want the latest quotes for several symbols in one request
+  So that a portfolio refresh costs one round trip instead of one per holding
+
+  Background:
+    Given the market data service is running
+
+  @regression @quotes
+  Scenario: Bulk quotes reuse the single-quote bodies
+    Given I have fetched the single quote for "VNM"
+    When I request bulk quotes for "vnm,FPT,VNM"
+    Then the bulk quote request should succeed
+    And the bulk quotes should be keyed by "VNM,FPT"
+    And the bulk quote for "VNM" should equal its single quote
+    And the bulk quote for "FPT" should contain a close price
+
+  @regression @quotes
+  Scenario: Bulk quotes report failing symbols inline
+    When I request bulk quotes for "VNM,BAD SYMBOL!"
+    Then the bulk quote request should succeed
+    And the bulk quotes should be keyed by "VNM,BAD SYMBOL!"
+    And the bulk quote for "VNM" should contain a close price
+    And the bulk quote for "BAD SYMBOL!" should be an error with status 422
+
+  @error-handling @quotes
+  Scenario: Bulk quotes accept up to 50 symbols
+    When I request bulk quotes for 50 distinct malformed symbols
+    Then the bulk quote request should succeed
+    And the bulk quotes should hold 50 entries
+    And every bulk quote should be an error with status 422
+
+  @error-handling @quotes
+  Scenario: Bulk quotes reject more than 50 symbols
+    When I request bulk quotes for 51 distinct malformed symbols
+    Then the bulk quote request should be rejected with status 400
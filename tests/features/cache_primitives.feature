@@ -0,0 +1,63 @@
+Feature: Cache Primitives
+  As a service maintainer
+  I want the in-process caching primitives to behave predictably under load
+  So that concurrent cache misses reach the provider once and expired data is served deliberately
+
+  These scenarios exercise the app modules directly and need the service
+  requirements installed, but not a running service.
+
+  @regression @cache
+  Scenario: Concurrent threads share one in-flight fetch
+    Given a fresh single-flight group
+    When 8 callers request the same key while its fetch is in flight
+    Then the shared fetch should have run once
+    And every caller should receive the shared result
+
+  @regression @cache
+  Scenario: A failed thread fetch is raised to every waiter
+    Given a fresh single-flight group
+    When 8 callers request the same key and its fetch fails
+    Then every caller should receive the fetch error
+    And the next request for the key should run a new fetch
+
+  @regression @cache
+  Scenario: Concurrent coroutines share one in-flight fetch
+    Given a fresh async single-flight group
+    When 8 callers request the same key while its fetch is in flight
+    Then the shared fetch should have run once
+    And every caller should receive the shared result
+
+  @regression @cache
+  Scenario: A failed coroutine fetch is raised to every waiter
+    Given a fresh async single-flight group
+    When 8 callers request the same key and its fetch fails
+    Then every caller should receive the fetch error
+    And the next request for the key should run a new fetch
+
+  @regression @cache
+  Scenario: A cancelled coroutine caller does not abort the shared fetch
+    Given a fresh async single-flight group
+    When 8 callers request the same key and the first caller is cancelled
+    Then the shared fetch should have run once
+    And only the cancelled caller should see the cancellation
+    And the next request for the key should run a new fetch
+
+  @regression @cache
+  Scenario: Cached response bodies expire and then fall back to stale
+    Given a response cache with a 0.2 second TTL and a 0.5 second stale window
+    When I cache a response body under "quote:VNM"
+    Then the cached body should be served as fresh
+    When 0.3 seconds have passed
+    Then the cached body should no longer be served as fresh
+    But the cached body should still be available as stale
+    When 0.5 seconds have passed
+    Then the cached body should no longer be available as stale
+
+  @regression @cache
+  Scenario: A per-entry TTL overrides the cache default
+    Given a response cache with a 5 second TTL and a 0 second stale window
+    When I cache a response body under "history:VNM" for 0.2 seconds
+    Then the cached body should be served as fresh
+    When 0.3 seconds have passed
+    Then the cached body should no longer be served as fresh
+    And the cached body should no longer be available as stale
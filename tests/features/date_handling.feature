@@ -0,0 +1,98 @@
+Feature: Date Handling
+  As a service maintainer
+  I want request dates and today's history row handled consistently
+  So that history responses never duplicate or drop the current trading day
+
+  These scenarios exercise the app modules directly and need the service
+  requirements installed, but not a running service.
+
+  @regression @dates
+  Scenario: Today's record is appended to history that ends before today
+    Given a history with the dates:
+      | date       |
+      | 2024-06-12 |
+      | 2024-06-13 |
+    When I merge a latest record dated "2024-06-14" as of "2024-06-14"
+    Then the history dates should be "2024-06-12,2024-06-13,2024-06-14"
+
+  @regression @dates
+  Scenario: Today's record is not duplicated when history already covers today
+    Given a history with the dates:
+      | date       |
+      | 2024-06-13 |
+      | 2024-06-14 |
+    When I merge a latest record dated "2024-06-14" as of "2024-06-14"
+    Then the history dates should be "2024-06-13,2024-06-14"
+
+  @regression @dates
+  Scenario: A latest record from an earlier day is not merged
+    Given a history with the dates:
+      | date       |
+      | 2024-06-12 |
+    When I merge a latest record dated "2024-06-13" as of "2024-06-14"
+    Then the history dates should be "2024-06-12"
+
+  @regression @dates
+  Scenario: A missing latest record leaves history unchanged
+    Given a history with the dates:
+      | date       |
+      | 2024-06-12 |
+    When I merge a missing latest record as of "2024-06-14"
+    Then the history dates should be "2024-06-12"
+
+  @regression @dates
+  Scenario: Today's record starts an empty history
+    Given an empty history
+    When I merge a latest record dated "2024-06-14" as of "2024-06-14"
+    Then the history dates should be "2024-06-14"
+
+  @regression @dates
+  Scenario: Today's record is merged in order when history runs past today
+    Given a history with the dates:
+      | date       |
+      | 2024-06-12 |
+      | 2024-06-17 |
+    When I merge a latest record dated "2024-06-14" as of "2024-06-14"
+    Then the history dates should be "2024-06-12,2024-06-14,2024-06-17"
+
+  @regression @dates
+  Scenario: History rows without a date do not break the merge
+    Given a history with the dates:
+      | date       |
+      | 2024-06-12 |
+      | -          |
+    When I merge a latest record dated "2024-06-14" as of "2024-06-14"
+    Then the history dates should be "2024-06-12,-,2024-06-14"
+
+  @regression @dates
+  Scenario: Today's date follows the local calendar
+    Given today's date was cached during an earlier second as "2000-01-01"
+    Then today's date should be the local calendar date
+
+  @regression @dates
+  Scenario Outline: Calendar dates are accepted and zero-padded
+    When I validate the request date "<value>"
+    Then the request date should be accepted as "<normalized>"
+
+    Examples:
+      | value      | normalized |
+      | 2024-06-14 | 2024-06-14 |
+      | 2024-02-29 | 2024-02-29 |
+      | 2024-1-5   | 2024-01-05 |
+      | 2024-12-31 | 2024-12-31 |
+
+  @regression @dates
+  Scenario Outline: Malformed or impossible dates are rejected
+    When I validate the request date "<value>"
+    Then the request date should be rejected
+
+    Examples:
+      | value            |
+      | 2023-02-29       |
+      | 2024-13-01       |
+      | 2024-04-31       |
+      | 0000-01-01       |
+      | 2024-06-14T00:00 |
+      | 14/06/2024       |
+      | ٢٠٢٤-٠٦-١٤       |
+      | 2024-06-         |
@@ -1,6 +1,13 @@
+import os
+import sys
 from behave import fixture, use_fixture
 from support.api_client import MarketDataAPI
 
+# In-process scenarios (cache primitives, date handling) import app modules directly
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
 
 @fixture
 def api_client(context):
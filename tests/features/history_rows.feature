@@ -0,0 +1,20 @@
+Feature: History Row Shape
+  As a Wealthfolio user
+  I want every history row to have the documented fields
+  So that responses look the same whether they came from the cache or the provider
+
+  These scenarios exercise the app modules directly and need the service
+  requirements installed, but not a running service.
+
+  @regression @history
+  Scenario: Cached and provider stock rows share the documented row shape
+    Given a cached stock history row for "VEA" dated "2024-06-12"
+    And a provider stock history row for "VEA" dated "2024-06-13"
+    When I build the stock history payload for "VEA"
+    Then every history row should have exactly the StockHistoryItem fields
+
+  @regression @history
+  Scenario: Today's merged quote row has the documented row shape
+    Given a cached stock history row for "VEA" dated "2024-06-13"
+    When I merge the stock quote for "VEA" dated "2024-06-14" as of "2024-06-14"
+    Then the last history row should have exactly the StockHistoryItem fields
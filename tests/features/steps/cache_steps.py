@@ -0,0 +1,209 @@
+import asyncio
+import threading
+import time
+from behave import given, when, then
+
+FLIGHT_KEY = "quote:VNM"
+SHARED_RESULT = {"symbol": "VNM", "close": 61500.0}
+
+
+class ProviderDown(Exception):
+    """Raised by the fake fetch in the failure scenarios"""
+
+
+def _run_thread_flight(context, callers, fail):
+    """Start callers threads on the same key and hold the fetch open until all have started"""
+    release = threading.Event()
+    calls_lock = threading.Lock()
+    outcomes = [None] * callers
+
+    def fetch():
+        with calls_lock:
+            context.flight_calls += 1
+        release.wait(timeout=5)
+        if fail:
+            raise context.flight_error
+        return SHARED_RESULT
+
+    def caller(index):
+        try:
+            outcomes[index] = context.flight_group.do(FLIGHT_KEY, fetch)
+        except Exception as e:
+            outcomes[index] = e
+
+    threads = [threading.Thread(target=caller, args=(i,)) for i in range(callers)]
+    for thread in threads:
+        thread.start()
+    # Give every caller time to join the in-flight fetch before it completes
+    time.sleep(0.2)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+    return outcomes
+
+
+def _run_async_flight(context, callers, fail):
+    """Gather callers coroutines on the same key; all join before the fetch's first await returns"""
+    async def fetch():
+        context.flight_calls += 1
+        await asyncio.sleep(0.05)
+        if fail:
+            raise context.flight_error
+        return SHARED_RESULT
+
+    async def run_all():
+        return await asyncio.gather(
+            *(context.flight_group.do(FLIGHT_KEY, fetch) for _ in range(callers)),
+            return_exceptions=True
+        )
+
+    return asyncio.run(run_all())
+
+
+def _run_async_flight_with_cancel(context, callers):
+    """Gather callers coroutines on the same key and cancel the first (the leader) mid-fetch"""
+    async def fetch():
+        context.flight_calls += 1
+        await asyncio.sleep(0.05)
+        return SHARED_RESULT
+
+    async def run_all():
+        tasks = [asyncio.ensure_future(context.flight_group.do(FLIGHT_KEY, fetch)) for _ in range(callers)]
+        await asyncio.sleep(0.01)
+        tasks[0].cancel()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    return asyncio.run(run_all())
+
+
+@given('a fresh single-flight group')
+def step_fresh_single_flight(context):
+    """Create an isolated SingleFlight so scenarios do not share in-flight keys"""
+    from app.cache.memory_cache import SingleFlight
+    context.flight_group = SingleFlight()
+    context.run_flight = _run_thread_flight
+    context.flight_calls = 0
+    context.flight_error = ProviderDown("provider unavailable")
+
+
+@given('a fresh async single-flight group')
+def step_fresh_async_single_flight(context):
+    """Create an isolated AsyncSingleFlight so scenarios do not share in-flight keys"""
+    from app.cache.memory_cache import AsyncSingleFlight
+    context.flight_group = AsyncSingleFlight()
+    context.run_flight = _run_async_flight
+    context.flight_calls = 0
+    context.flight_error = ProviderDown("provider unavailable")
+
+
+@when('{callers:d} callers request the same key while its fetch is in flight')
+def step_concurrent_flight(context, callers):
+    """Issue concurrent requests for one key with a fetch that succeeds"""
+    context.flight_outcomes = context.run_flight(context, callers, fail=False)
+
+
+@when('{callers:d} callers request the same key and its fetch fails')
+def step_concurrent_failing_flight(context, callers):
+    """Issue concurrent requests for one key with a fetch that raises"""
+    context.flight_outcomes = context.run_flight(context, callers, fail=True)
+
+
+@when('{callers:d} callers request the same key and the first caller is cancelled')
+def step_concurrent_flight_with_cancel(context, callers):
+    """Issue concurrent requests for one key, then cancel the caller that started the fetch"""
+    context.flight_outcomes = _run_async_flight_with_cancel(context, callers)
+
+
+@then('only the cancelled caller should see the cancellation')
+def step_only_cancelled_caller(context):
+    """Assert the leader was cancelled while every follower still got the shared result"""
+    cancelled, *others = context.flight_outcomes
+    assert isinstance(cancelled, asyncio.CancelledError), f"Expected the first caller to be cancelled, got {cancelled!r}"
+    for outcome in others:
+        assert outcome is SHARED_RESULT, f"Expected the shared result, got {outcome!r}"
+
+
+@then('the shared fetch should have run once')
+def step_fetch_ran_once(context):
+    """Assert concurrent callers were collapsed into a single fetch"""
+    assert context.flight_calls == 1, f"Expected 1 fetch, got {context.flight_calls}"
+
+
+@then('every caller should receive the shared result')
+def step_every_caller_result(context):
+    """Assert leader and followers all got the leader's result"""
+    for outcome in context.flight_outcomes:
+        assert outcome is SHARED_RESULT, f"Expected the shared result, got {outcome!r}"
+
+
+@then('every caller should receive the fetch error')
+def step_every_caller_error(context):
+    """Assert the leader's exception reached every waiter"""
+    for outcome in context.flight_outcomes:
+        assert outcome is context.flight_error, f"Expected the fetch error, got {outcome!r}"
+
+
+@then('the next request for the key should run a new fetch')
+def step_next_request_fetches(context):
+    """Assert a failed fetch is not left in flight for later callers"""
+    calls_before = context.flight_calls
+    outcomes = context.run_flight(context, 1, fail=False)
+    assert context.flight_calls == calls_before + 1, "A later request should start a new fetch"
+    assert outcomes[0] is SHARED_RESULT, f"Expected the new fetch's result, got {outcomes[0]!r}"
+
+
+@given('a response cache with a {ttl:g} second TTL and a {stale_ttl:g} second stale window')
+def step_response_cache(context, ttl, stale_ttl):
+    """Create an isolated TTLResponseCache"""
+    from app.cache.response_cache import TTLResponseCache
+    context.response_cache = TTLResponseCache(maxsize=16, ttl=ttl, stale_ttl=stale_ttl)
+
+
+@when('I cache a response body under "{key}"')
+def step_cache_body(context, key):
+    """Store a body with the cache's default TTL"""
+    context.cache_key = key
+    context.cached_body = b'{"symbol":"VNM","close":61500.0}'
+    context.response_cache.set(key, context.cached_body)
+
+
+@when('I cache a response body under "{key}" for {ttl:g} seconds')
+def step_cache_body_with_ttl(context, key, ttl):
+    """Store a body with a per-entry TTL"""
+    context.cache_key = key
+    context.cached_body = b'{"symbol":"VNM","history":[]}'
+    context.response_cache.set(key, context.cached_body, ttl=ttl)
+
+
+@when('{seconds:g} seconds have passed')
+def step_seconds_passed(context, seconds):
+    """Let cache entries age"""
+    time.sleep(seconds)
+
+
+@then('the cached body should be served as fresh')
+def step_body_fresh(context):
+    """Assert get returns the stored body"""
+    body = context.response_cache.get(context.cache_key)
+    assert body == context.cached_body, f"Expected a fresh hit, got {body!r}"
+
+
+@then('the cached body should no longer be served as fresh')
+def step_body_not_fresh(context):
+    """Assert get treats the entry as expired"""
+    body = context.response_cache.get(context.cache_key)
+    assert body is None, f"Expected the entry to have expired, got {body!r}"
+
+
+@then('the cached body should still be available as stale')
+def step_body_stale(context):
+    """Assert get_stale still falls back to the expired body"""
+    body = context.response_cache.get_stale(context.cache_key)
+    assert body == context.cached_body, f"Expected the stale body, got {body!r}"
+
+
+@then('the cached body should no longer be available as stale')
+def step_body_not_stale(context):
+    """Assert the entry is gone once the stale window has passed"""
+    body = context.response_cache.get_stale(context.cache_key)
+    assert body is None, f"Expected no stale body, got {body!r}"
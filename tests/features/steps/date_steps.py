@@ -0,0 +1,81 @@
+import time
+from datetime import date
+from behave import given, when, then
+
+# History rows without a date are written as "-" in tables and expected date lists
+MISSING_DATE = "-"
+
+
+def _history_row(row_date):
+    return {"date": None if row_date == MISSING_DATE else row_date, "close": 61500.0}
+
+
+@given('a history with the dates:')
+def step_history_with_dates(context):
+    """Build ascending history rows from the step table"""
+    context.history_rows = [_history_row(row["date"]) for row in context.table]
+
+
+@given('an empty history')
+def step_empty_history(context):
+    """Start from a symbol with no stored history"""
+    context.history_rows = []
+
+
+@when('I merge a latest record dated "{record_date}" as of "{today}"')
+def step_merge_latest_record(context, record_date, today):
+    """Merge the latest quote/NAV record into the history the way /history does"""
+    from app.constants import ASSET_TYPE_STOCK
+    from app.main import _merge_today
+    _merge_today(context.history_rows, _history_row(record_date), today, ASSET_TYPE_STOCK)
+
+
+@when('I merge a missing latest record as of "{today}"')
+def step_merge_missing_record(context, today):
+    """Merge when the provider had no latest record"""
+    from app.constants import ASSET_TYPE_STOCK
+    from app.main import _merge_today
+    _merge_today(context.history_rows, None, today, ASSET_TYPE_STOCK)
+
+
+@then('the history dates should be "{dates}"')
+def step_history_dates(context, dates):
+    """Assert the merged history dates, in order"""
+    actual = [row["date"] or MISSING_DATE for row in context.history_rows]
+    assert actual == dates.split(","), f"Expected history dates {dates}, got {','.join(actual)}"
+
+
+@given("today's date was cached during an earlier second as \"{cached}\"")
+def step_stale_today_cache(context, cached):
+    """Leave a stale per-second cache entry behind"""
+    from app.utils import date_utils
+    date_utils._today_cache = (int(time.time()) - 1, cached)
+
+
+@then("today's date should be the local calendar date")
+def step_today_is_local_date(context):
+    """Assert today_str recomputes once its cached second has passed"""
+    from app.utils.date_utils import today_str
+    assert today_str() == date.today().isoformat(), f"Expected {date.today().isoformat()}, got {today_str()}"
+
+
+@when('I validate the request date "{value}"')
+def step_validate_request_date(context, value):
+    """Run the request-date validators on value"""
+    from app.utils.date_utils import is_valid_ymd, normalize_ymd
+    context.date_valid = is_valid_ymd(value)
+    context.normalized_date = normalize_ymd(value)
+
+
+@then('the request date should be accepted as "{normalized}"')
+def step_request_date_accepted(context, normalized):
+    """Assert the date is valid and normalized to zero-padded YYYY-MM-DD"""
+    assert context.date_valid, "Expected the date to be valid"
+    assert context.normalized_date == normalized, f"Expected {normalized}, got {context.normalized_date}"
+
+
+@then('the request date should be rejected')
+def step_request_date_rejected(context):
+    """Assert the date is rejected by both validators"""
+    assert not context.date_valid, "Expected the date to be invalid"
+    assert context.normalized_date is None, f"Expected no normalized date, got {context.normalized_date}"
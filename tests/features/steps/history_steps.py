@@ -0,0 +1,56 @@
+from behave import given, when, then
+
+PRICE_FIELDS = {"nav": 61500.0, "open": 61000.0, "high": 62000.0, "low": 60800.0,
+                "close": 61500.0, "adjclose": 61500.0, "volume": 1200000.0}
+
+
+def _expected_fields(model_name):
+    from app import models
+    return set(getattr(models, model_name).model_fields)
+
+
+@given('a cached stock history row for "{symbol}" dated "{row_date}"')
+def step_cached_stock_row(context, symbol, row_date):
+    """Add a row shaped like the historical cache returns it (gold price columns included)"""
+    context.history_rows = getattr(context, "history_rows", None) or []
+    context.history_rows.append({"date": row_date, **PRICE_FIELDS, "buy_price": 0.0, "sell_price": 0.0})
+
+
+@given('a provider stock history row for "{symbol}" dated "{row_date}"')
+def step_provider_stock_row(context, symbol, row_date):
+    """Add a row shaped like a fresh provider fetch returns it (per-row symbol included)"""
+    context.history_rows = getattr(context, "history_rows", None) or []
+    context.history_rows.append({"symbol": symbol, "date": row_date, **PRICE_FIELDS})
+
+
+@when('I build the stock history payload for "{symbol}"')
+def step_build_stock_payload(context, symbol):
+    """Build the /history body the way the stock routes do"""
+    from app.constants import ASSET_TYPE_STOCK
+    from app.main import _history_payload
+    context.history_rows = _history_payload(symbol, context.history_rows, ASSET_TYPE_STOCK)["history"]
+
+
+@when('I merge the stock quote for "{symbol}" dated "{quote_date}" as of "{today}"')
+def step_merge_stock_quote(context, symbol, quote_date, today):
+    """Merge a latest quote into the history the way /history does for stocks"""
+    from app.constants import ASSET_TYPE_STOCK
+    from app.main import _merge_today, _quote_history_record
+    quote = {"symbol": symbol, "date": quote_date, **PRICE_FIELDS}
+    _merge_today(context.history_rows, _quote_history_record(symbol, quote), today, ASSET_TYPE_STOCK)
+
+
+@then('every history row should have exactly the {model_name} fields')
+def step_every_row_fields(context, model_name):
+    """Assert no row carries keys outside the item model, and none are missing"""
+    expected = _expected_fields(model_name)
+    for row in context.history_rows:
+        assert set(row) == expected, f"Row {row} should have exactly {sorted(expected)}"
+
+
+@then('the last history row should have exactly the {model_name} fields')
+def step_last_row_fields(context, model_name):
+    """Assert the merged row was trimmed to the item model"""
+    expected = _expected_fields(model_name)
+    row = context.history_rows[-1]
+    assert set(row) == expected, f"Row {row} should have exactly {sorted(expected)}"
@@ -0,0 +1,82 @@
+from behave import given, when, then
+
+
+@given('I have fetched the single quote for "{symbol}"')
+def step_fetch_single_quote(context, symbol):
+    """Fetch /quote/{symbol} so the bulk request can be compared with it"""
+    quote = context.api.get_quote(symbol)
+    assert "close" in quote, f"Single quote for {symbol} should contain a close price: {quote}"
+    context.single_quotes = getattr(context, "single_quotes", {})
+    context.single_quotes[symbol] = quote
+
+
+@when('I request bulk quotes for "{symbols}"')
+def step_request_bulk_quotes(context, symbols):
+    """Request /quotes for a comma-separated symbol list"""
+    context.bulk_response = context.api.get_quotes(symbols.split(","))
+
+
+@when('I request bulk quotes for {count:d} distinct malformed symbols')
+def step_request_malformed_bulk_quotes(context, count):
+    """Request /quotes for symbols that fail validation, so no provider call is made"""
+    context.bulk_response = context.api.get_quotes([f"BAD!{i}" for i in range(count)])
+
+
+@then('the bulk quote request should succeed')
+def step_bulk_quotes_succeeded(context):
+    """Assert /quotes answered 200 with a JSON object"""
+    assert context.bulk_response.status_code == 200, \
+        f"Expected 200, got {context.bulk_response.status_code}: {context.bulk_response.text}"
+    context.bulk_quotes = context.bulk_response.json()
+    assert isinstance(context.bulk_quotes, dict), "Bulk quotes should be a JSON object"
+
+
+@then('the bulk quote request should be rejected with status {status:d}')
+def step_bulk_quotes_rejected(context, status):
+    """Assert /quotes rejected the whole request"""
+    assert context.bulk_response.status_code == status, \
+        f"Expected {status}, got {context.bulk_response.status_code}"
+    assert "detail" in context.bulk_response.json(), "Rejection should carry a detail message"
+
+
+@then('the bulk quotes should be keyed by "{symbols}"')
+def step_bulk_quotes_keys(context, symbols):
+    """Assert one entry per distinct upper-cased symbol, in request order"""
+    expected = symbols.split(",")
+    assert list(context.bulk_quotes) == expected, f"Expected keys {expected}, got {list(context.bulk_quotes)}"
+
+
+@then('the bulk quotes should hold {count:d} entries')
+def step_bulk_quotes_count(context, count):
+    """Assert one entry per requested symbol"""
+    assert len(context.bulk_quotes) == count, f"Expected {count} entries, got {len(context.bulk_quotes)}"
+
+
+@then('the bulk quote for "{symbol}" should equal its single quote')
+def step_bulk_quote_matches_single(context, symbol):
+    """Assert the bulk entry is the same body /quote/{symbol} returned"""
+    assert context.bulk_quotes[symbol] == context.single_quotes[symbol], \
+        f"Bulk quote {context.bulk_quotes[symbol]} differs from single quote {context.single_quotes[symbol]}"
+
+
+@then('the bulk quote for "{symbol}" should contain a close price')
+def step_bulk_quote_has_close(context, symbol):
+    """Assert the bulk entry is a quote rather than an error"""
+    quote = context.bulk_quotes[symbol]
+    assert "error" not in quote, f"Expected a quote for {symbol}, got {quote}"
+    assert quote.get("close") is not None, f"Quote for {symbol} should contain a close price: {quote}"
+
+
+@then('the bulk quote for "{symbol}" should be an error with status {status:d}')
+def step_bulk_quote_error(context, symbol, status):
+    """Assert a failing symbol is reported inline"""
+    entry = context.bulk_quotes[symbol]
+    assert entry.get("status_code") == status, f"Expected status {status} for {symbol}, got {entry}"
+    assert entry.get("error"), f"Error entry for {symbol} should carry a message: {entry}"
+
+
+@then('every bulk quote should be an error with status {status:d}')
+def step_every_bulk_quote_error(context, status):
+    """Assert every entry was reported inline with the given status"""
+    for symbol, entry in context.bulk_quotes.items():
+        assert entry.get("status_code") == status, f"Expected status {status} for {symbol}, got {entry}"
@@ -1,7 +1,7 @@
 import httpx
 import time
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 
 class MarketDataAPI:
@@ -50,6 +50,10 @@ class MarketDataAPI:
         response = self.client.get(f"{self.base_url}/history/{symbol}", params={"days": days})
         return response.json()
     
+    def get_quotes(self, symbols: List[str]) -> httpx.Response:
+        """Get latest quotes for several symbols; returns the raw response so status codes can be checked"""
+        return self.client.get(f"{self.base_url}/quotes", params={"symbols": ",".join(symbols)})
+    
     def close(self):
         """Close the HTTP client"""
         self.client.close()
\ No newline at end of file